@@ -58,6 +58,24 @@ def get_provisioned_product_from_scan(
     return None
 
 
+def search_provisioned_products_by_name(service_catalog, provisioned_product_name):
+    # the name filter is a search so it can also return partial matches
+    provisioned_products = list()
+    kwargs = dict(
+        AccessLevelFilter={"Key": "Account", "Value": "self"},
+        Filters={"SearchQuery": [f"name:{provisioned_product_name}"]},
+        PageSize=100,
+    )
+    while True:
+        response = service_catalog.search_provisioned_products(**kwargs)
+        for provisioned_product in response.get("ProvisionedProducts", []):
+            if provisioned_product.get("Name") == provisioned_product_name:
+                provisioned_products.append(provisioned_product)
+        if not response.get("NextPageToken"):
+            return provisioned_products
+        kwargs["PageToken"] = response.get("NextPageToken")
+
+
 def terminate_if_status_is_not_available(
     service_catalog, provisioned_product_name, product_id, account_id, region
 ):
@@ -123,12 +141,13 @@ def get_default_parameters_for_stack(cloudformation, stack_name):
     return existing_stack_params_dict
 
 
-def get_parameters_for_stack(cloudformation, stack_name):
+def get_parameters_for_stack(cloudformation, stack_name, stack=None):
     existing_stack_params_dict = get_default_parameters_for_stack(
         cloudformation, stack_name
     )
 
-    stack = get_stack_output_for(cloudformation, stack_name)
+    if stack is None:
+        stack = get_stack_output_for(cloudformation, stack_name)
     for stack_param in stack.get("Parameters", []):
         existing_stack_params_dict[stack_param.get("ParameterKey")] = stack_param.get(
             "ParameterValue"
@@ -0,0 +1,56 @@
+# Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from unittest import mock as mocker
+from unittest.mock import call
+
+
+def test_search_provisioned_products_by_name():
+    # setup
+    from servicecatalog_puppet import aws as sut
+
+    service_catalog = mocker.MagicMock()
+    service_catalog.search_provisioned_products.side_effect = [
+        {
+            "ProvisionedProducts": [
+                {"Id": "pp-near-miss", "Name": "launch-a-copy"},
+                {"Id": "pp-1", "Name": "launch-a"},
+            ],
+            "NextPageToken": "token",
+        },
+        {"ProvisionedProducts": [{"Id": "pp-2", "Name": "launch-a"}]},
+    ]
+    expected_kwargs = dict(
+        AccessLevelFilter={"Key": "Account", "Value": "self"},
+        Filters={"SearchQuery": ["name:launch-a"]},
+        PageSize=100,
+    )
+
+    # exercise
+    actual_result = sut.search_provisioned_products_by_name(service_catalog, "launch-a")
+
+    # verify
+    assert actual_result == [
+        {"Id": "pp-1", "Name": "launch-a"},
+        {"Id": "pp-2", "Name": "launch-a"},
+    ]
+    assert service_catalog.search_provisioned_products.call_args_list == [
+        call(**expected_kwargs),
+        call(**expected_kwargs, PageToken="token"),
+    ]
+
+
+def test_search_provisioned_products_by_name_without_a_match():
+    # setup
+    from servicecatalog_puppet import aws as sut
+
+    service_catalog = mocker.MagicMock()
+    service_catalog.search_provisioned_products.return_value = {
+        "ProvisionedProducts": [{"Id": "pp-near-miss", "Name": "launch-a-copy"}],
+    }
+
+    # exercise
+    actual_result = sut.search_provisioned_products_by_name(service_catalog, "launch-a")
+
+    # verify
+    assert actual_result == []
+    assert service_catalog.search_provisioned_products.call_count == 1
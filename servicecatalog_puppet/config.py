@@ -157,7 +157,7 @@ def get_puppet_role_path():
     )
 
 
-@functools.lru_cache()
+@functools.lru_cache(maxsize=None)
 def get_puppet_role_arn(puppet_account_id):
     logger.info("getting puppet_role_arn")
     return f"arn:{get_partition()}:iam::{puppet_account_id}:role{get_puppet_role_path()}{get_puppet_role_name()}"
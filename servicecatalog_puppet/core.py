@@ -7,6 +7,7 @@ import os
 import shutil
 import time
 import traceback
+import types
 import urllib
 import zipfile
 from datetime import datetime
@@ -165,7 +166,7 @@ def graph_nodes(what):
     if isinstance(what, puppet_tasks.PuppetTask):
         nodes.append(what.graph_node())
         nodes += graph_nodes(what.requires())
-    elif isinstance(what, list):
+    elif isinstance(what, (list, types.GeneratorType)):
         for i in what:
             nodes += graph_nodes(i)
     elif isinstance(what, dict):
@@ -181,7 +182,7 @@ def graph_lines(task, dependency):
     if isinstance(dependency, puppet_tasks.PuppetTask):
         nodes.append(f'"{task.node_id}" -> "{dependency.node_id}"')
         # nodes += graph_lines(task, task.requires())
-    elif isinstance(dependency, list):
+    elif isinstance(dependency, (list, types.GeneratorType)):
         for i in dependency:
             nodes += graph_lines(task, i)
     elif isinstance(dependency, dict):
@@ -203,7 +204,7 @@ def graph(f):
         what = task.requires()
         if isinstance(what, puppet_tasks.PuppetTask):
             lines.append(f'"{task.node_id}" -> "{what.node_id}"')
-        elif isinstance(what, list):
+        elif isinstance(what, (list, types.GeneratorType)):
             for item in what:
                 lines += graph_lines(task, item)
         elif isinstance(what, dict):
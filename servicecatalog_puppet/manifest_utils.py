@@ -11,6 +11,7 @@ from deepmerge import always_merger
 
 from servicecatalog_puppet import config
 from servicecatalog_puppet import constants
+from servicecatalog_puppet import utils
 from servicecatalog_puppet.macros import macros
 
 logger = logging.getLogger(__file__)
@@ -564,6 +565,48 @@ class Manifest(dict):
                 )
         return provisioning_tasks
 
+    @utils.memoize
+    def get_tasks_index_for(
+        self, puppet_account_id, section_name, item_name, single_account="None"
+    ):
+        index = dict(
+            by_region=dict(),
+            by_account=dict(),
+            by_account_and_region=dict(),
+            regions_by_account=dict(),
+        )
+        for task in self.get_tasks_for(
+            puppet_account_id, section_name, item_name, single_account=single_account,
+        ):
+            account_id = task.get("account_id")
+            region = task.get("region")
+            index["by_region"].setdefault(region, []).append(task)
+            index["by_account"].setdefault(account_id, []).append(task)
+            by_account_and_region = index["by_account_and_region"]
+            if (account_id, region) not in by_account_and_region:
+                index["regions_by_account"].setdefault(account_id, []).append(region)
+            by_account_and_region.setdefault((account_id, region), []).append(task)
+        return index
+
+    @utils.memoize
+    def get_depends_on_index_for(self, section_name, item_name):
+        index = dict()
+        item = self.get(section_name).get(item_name)
+        for depends_on in item.get("depends_on", []):
+            index.setdefault(
+                (depends_on.get("type"), depends_on.get(constants.AFFINITY)), []
+            ).append(depends_on.get("name"))
+        return index
+
+    def get_depends_on_names_for(
+        self, section_name, item_name, depends_on_type, affinity
+    ):
+        return list(
+            self.get_depends_on_index_for(section_name, item_name).get(
+                (depends_on_type, affinity), []
+            )
+        )
+
     def get_tasks_for_launch_and_region(
         self,
         puppet_account_id,
@@ -572,16 +615,16 @@ class Manifest(dict):
         region,
         single_account="None",
     ):
-        return [
-            task
-            for task in self.get_tasks_for(
+        return list(
+            self.get_tasks_index_for(
                 puppet_account_id,
                 section_name,
                 launch_name,
                 single_account=single_account,
             )
-            if task.get("region") == region
-        ]
+            .get("by_region")
+            .get(region, [])
+        )
 
     def get_tasks_for_launch_and_account(
         self,
@@ -591,16 +634,16 @@ class Manifest(dict):
         account_id,
         single_account="None",
     ):
-        return [
-            task
-            for task in self.get_tasks_for(
+        return list(
+            self.get_tasks_index_for(
                 puppet_account_id,
                 section_nam,
                 launch_name,
                 single_account=single_account,
             )
-            if task.get("account_id") == account_id
-        ]
+            .get("by_account")
+            .get(account_id, [])
+        )
 
     def get_tasks_for_launch_and_account_and_region(
         self,
@@ -611,52 +654,46 @@ class Manifest(dict):
         region,
         single_account="None",
     ):
-        return [
-            task
-            for task in self.get_tasks_for(
+        return list(
+            self.get_tasks_index_for(
                 puppet_account_id,
                 section_name,
                 launch_name,
                 single_account=single_account,
             )
-            if task.get("account_id") == account_id and task.get("region") == region
-        ]
+            .get("by_account_and_region")
+            .get((account_id, region), [])
+        )
 
     def get_regions_used_for_section_item(
         self, puppet_account_id, section_name, item_name
     ):
         return list(
-            set(
-                task.get("region")
-                for task in self.get_tasks_for(
-                    puppet_account_id, section_name, item_name
-                )
-            )
+            self.get_tasks_index_for(puppet_account_id, section_name, item_name)
+            .get("by_region")
+            .keys()
         )
 
     def get_account_ids_used_for_section_item(
         self, puppet_account_id, section_name, item_name
     ):
         return list(
-            set(
-                task.get("account_id")
-                for task in self.get_tasks_for(
-                    puppet_account_id, section_name, item_name
-                )
-            )
+            self.get_tasks_index_for(puppet_account_id, section_name, item_name)
+            .get("by_account")
+            .keys()
         )
 
     def get_account_ids_and_regions_used_for_section_item(
         self, puppet_account_id, section_name, item_name
     ):
-        result = dict()
-        for task in self.get_tasks_for(puppet_account_id, section_name, item_name):
-            if result.get(task.get("account_id")) is None:
-                result[task.get("account_id")] = list()
-            result[task.get("account_id")].append(task.get("region"))
-        for account_id in result.keys():
-            result[account_id] = list(set(result[account_id]))
-        return result
+        return {
+            account_id: list(regions)
+            for account_id, regions in self.get_tasks_index_for(
+                puppet_account_id, section_name, item_name
+            )
+            .get("regions_by_account")
+            .items()
+        }
 
     def get_mapping(self, mapping, account_id, region):
         manifest_mappings = self.get("mappings")
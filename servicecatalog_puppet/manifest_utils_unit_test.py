@@ -301,6 +301,69 @@ class TestManifest(unittest.TestCase):
         # verify
         self.assertListEqual(expected_result, actual_results)
 
+    def test_get_account_ids_and_regions_used_for_section_item(self):
+        # setup
+        puppet_account_id = "01234567890"
+        section_name = "launches"
+        item_name = "launch_a"
+        self.sut.update(deepcopy(self.accounts))
+        self.sut.get("accounts").append(
+            {
+                "account_id": "9875983465794387",
+                "default_region": "eu-west-3",
+                "name": "accounta",
+                "expanded_from": "ou-aaaa-aaaaaaaa",
+                "organization": "o-aaaaaaaa",
+                "regions_enabled": ["eu-west-2",],
+                "tags": ["group:A"],
+            }
+        )
+        self.sut.update(deepcopy(self.launches))
+        expected_result = {
+            "012345678910": ["eu-west-1"],
+            "9875983465794387": ["eu-west-3"],
+        }
+
+        # exercise
+        actual_results = self.sut.get_account_ids_and_regions_used_for_section_item(
+            puppet_account_id, section_name, item_name
+        )
+
+        # verify
+        self.assertDictEqual(expected_result, actual_results)
+        self.assertListEqual(
+            [],
+            self.sut.get_tasks_for_launch_and_account_and_region(
+                puppet_account_id, section_name, item_name, "012345678910", "eu-west-3",
+            ),
+        )
+
+    def test_get_depends_on_names_for(self):
+        # setup
+        section_name = "launches"
+        item_name = "launch_a"
+        self.sut.update(deepcopy(self.launches))
+        self.sut.get(section_name).get(item_name)["depends_on"] = [
+            {"name": "launch_b", "type": "launches", "affinity": "region"},
+            {"name": "launch_c", "type": "launches", "affinity": "launch"},
+            {"name": "assertion_a", "type": "assertions", "affinity": "region"},
+        ]
+        expected_result = ["launch_b"]
+
+        # exercise
+        actual_result = self.sut.get_depends_on_names_for(
+            section_name, item_name, "launches", "region"
+        )
+
+        # verify
+        self.assertListEqual(expected_result, actual_result)
+        self.assertListEqual(
+            [],
+            self.sut.get_depends_on_names_for(
+                section_name, item_name, "launches", "account"
+            ),
+        )
+
     def test_get_accounts_by_region(self):
         # setup
         self.sut.update(deepcopy(self.accounts))
@@ -1,6 +1,32 @@
 # Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
+import functools
 
 
 def slugify_for_cloudformation_stack_name(raw) -> str:
     return raw.replace("_", "-")
+
+
+def replace_aws_placeholders(raw, account_id, region) -> str:
+    if "${" not in raw:
+        return raw
+    return raw.replace("${AWS::Region}", region).replace(
+        "${AWS::AccountId}", account_id
+    )
+
+
+def memoize(function):
+    # parameters and the loaded manifest never change, so results are kept in the
+    # instance __dict__: unlike lru_cache this keeps instances picklable and free
+    # of reference cycles, and cached_property is not available on python 3.7
+    key = f"memoized_{function.__qualname__}"
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        results = self.__dict__.setdefault(key, dict())
+        arguments = (args, tuple(sorted(kwargs.items())))
+        if arguments not in results:
+            results[arguments] = function(self, *args, **kwargs)
+        return results[arguments]
+
+    return wrapper
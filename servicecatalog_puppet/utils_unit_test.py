@@ -0,0 +1,55 @@
+# Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+
+class MemoizeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        from servicecatalog_puppet import utils
+
+        self.module = utils
+
+        class Memoized(object):
+            def __init__(self):
+                self.calls = []
+
+            @utils.memoize
+            def get(self, name, suffix=""):
+                self.calls.append((name, suffix))
+                return [name + suffix]
+
+        self.sut = Memoized()
+
+    def test_memoize(self):
+        # setup
+        # exercise
+        first = self.sut.get("a")
+        second = self.sut.get("a")
+
+        # verify
+        self.assertIs(first, second)
+        self.assertEqual([("a", "")], self.sut.calls)
+
+    def test_memoize_is_keyed_on_arguments(self):
+        # setup
+        # exercise
+        self.sut.get("a")
+        self.sut.get("b")
+        self.sut.get("a", suffix="-1")
+
+        # verify
+        self.assertEqual([("a", ""), ("b", ""), ("a", "-1")], self.sut.calls)
+        self.assertEqual(["a-1"], self.sut.get("a", suffix="-1"))
+
+    def test_memoize_is_per_instance(self):
+        # setup
+        other = type(self.sut)()
+
+        # exercise
+        self.sut.get("a")
+        other.get("a")
+
+        # verify
+        self.assertEqual([("a", "")], self.sut.calls)
+        self.assertEqual([("a", "")], other.calls)
+        self.assertIsNot(self.sut.get("a"), other.get("a"))
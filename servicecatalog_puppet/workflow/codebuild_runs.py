@@ -1,9 +1,53 @@
+from concurrent import futures
+import logging
+import sys
+import time
+
 import luigi
 
 from servicecatalog_puppet import constants
 from servicecatalog_puppet.workflow import manifest as manifest_tasks
 from servicecatalog_puppet.workflow import tasks as workflow_tasks, dependency
 
+logger = logging.getLogger(__file__)
+
+BATCH_GET_PROJECTS_MAX_NAMES = 100
+BATCH_GET_PROJECTS_MAX_WORKERS = 8
+BUILD_POLL_INTERVAL_IN_SECONDS = 5
+
+
+def get_projects(codebuild, project_names):
+    projects = dict()
+    batches = [
+        list(project_names[i : i + BATCH_GET_PROJECTS_MAX_NAMES])
+        for i in range(0, len(project_names), BATCH_GET_PROJECTS_MAX_NAMES)
+    ]
+    if len(batches) > 1:
+        with futures.ThreadPoolExecutor(
+            max_workers=min(len(batches), BATCH_GET_PROJECTS_MAX_WORKERS)
+        ) as executor:
+            results = list(
+                executor.map(
+                    lambda names: codebuild.batch_get_projects(names=names), batches
+                )
+            )
+    else:
+        results = [codebuild.batch_get_projects(names=names) for names in batches]
+    for result in results:
+        for project in result.get("projects", []):
+            projects[project.get("name")] = project
+    return projects
+
+
+def start_build_and_wait_for_completion(codebuild, **kwargs):
+    build = codebuild.start_build(**kwargs).get("build")
+    build_id = build.get("id")
+    while build.get("buildStatus") == "IN_PROGRESS":
+        time.sleep(BUILD_POLL_INTERVAL_IN_SECONDS)
+        build = codebuild.batch_get_builds(ids=[build_id]).get("builds")[0]
+        logger.info(f"{build_id} current status: {build.get('buildStatus')}")
+    return build
+
 
 class CodeBuildRunBaseTask(workflow_tasks.PuppetTaskWithParameters):
     manifest_file_path = luigi.Parameter()
@@ -13,6 +57,61 @@ class CodeBuildRunBaseTask(workflow_tasks.PuppetTaskWithParameters):
         return constants.CODE_BUILD_RUNS
 
 
+class BatchGetProjectsTask(CodeBuildRunBaseTask):
+    puppet_account_id = luigi.Parameter()
+    project_names = luigi.ListParameter()
+
+    # every project name would end up in the output path, which gets too long
+    results_display_keys = ("puppet_account_id", "cache_invalidator")
+
+    def api_calls_used(self):
+        return [
+            f"codebuild.batch_get_projects_{self.puppet_account_id}",
+        ]
+
+    def run(self):
+        with self.hub_client("codebuild") as codebuild:
+            self.write_output(get_projects(codebuild, self.project_names))
+
+
+class ProjectEnvironmentDiscoveryTask(
+    CodeBuildRunBaseTask, manifest_tasks.ManifestMixen
+):
+    puppet_account_id = luigi.Parameter()
+    project_name = luigi.Parameter()
+
+    results_display_keys = ("puppet_account_id", "project_name", "cache_invalidator")
+
+    def get_project_names(self):
+        return sorted(
+            set(
+                details.get("project_name")
+                for details in self.manifest.get(constants.CODE_BUILD_RUNS, {}).values()
+            )
+        )
+
+    def requires(self):
+        return {
+            "projects": BatchGetProjectsTask(
+                manifest_file_path=self.manifest_file_path,
+                puppet_account_id=self.puppet_account_id,
+                project_names=self.get_project_names(),
+            ),
+        }
+
+    def run(self):
+        project = self.load_from_input("projects").get(self.project_name, {})
+        self.write_output(
+            [
+                environment_variable.get("name")
+                for environment_variable in project.get("environment", {}).get(
+                    "environmentVariables", []
+                )
+                if environment_variable.get("type") == "PLAINTEXT"
+            ]
+        )
+
+
 class ExecuteCodeBuildRunTask(
     CodeBuildRunBaseTask, manifest_tasks.ManifestMixen, dependency.DependenciesMixin
 ):
@@ -22,8 +121,6 @@ class ExecuteCodeBuildRunTask(
     region = luigi.Parameter()
     account_id = luigi.Parameter()
 
-    ssm_param_inputs = luigi.ListParameter(default=[], significant=False)
-
     launch_parameters = luigi.DictParameter(default={}, significant=False)
     manifest_parameters = luigi.DictParameter(default={}, significant=False)
     account_parameters = luigi.DictParameter(default={}, significant=False)
@@ -31,17 +128,16 @@ class ExecuteCodeBuildRunTask(
     project_name = luigi.Parameter()
     requested_priority = luigi.IntParameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "code_build_run_name": self.code_build_run_name,
-            "region": self.region,
-            "account_id": self.account_id,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "code_build_run_name",
+        "region",
+        "account_id",
+        "cache_invalidator",
+    )
 
     def requires(self):
-        return dict(section_dependencies=self.get_section_dependencies())
+        return {"section_dependencies": self.get_section_dependencies()}
 
     def run(self):
         yield DoExecuteCodeBuildRunTask(
@@ -50,7 +146,6 @@ class ExecuteCodeBuildRunTask(
             puppet_account_id=self.puppet_account_id,
             region=self.region,
             account_id=self.account_id,
-            ssm_param_inputs=self.ssm_param_inputs,
             launch_parameters=self.launch_parameters,
             manifest_parameters=self.manifest_parameters,
             account_parameters=self.account_parameters,
@@ -69,8 +164,6 @@ class DoExecuteCodeBuildRunTask(
     region = luigi.Parameter()
     account_id = luigi.Parameter()
 
-    ssm_param_inputs = luigi.ListParameter(default=[], significant=False)
-
     launch_parameters = luigi.DictParameter(default={}, significant=False)
     manifest_parameters = luigi.DictParameter(default={}, significant=False)
     account_parameters = luigi.DictParameter(default={}, significant=False)
@@ -78,58 +171,55 @@ class DoExecuteCodeBuildRunTask(
     project_name = luigi.Parameter()
     requested_priority = luigi.IntParameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "code_build_run_name": self.code_build_run_name,
-            "region": self.region,
-            "account_id": self.account_id,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "code_build_run_name",
+        "region",
+        "account_id",
+        "cache_invalidator",
+    )
 
     def api_calls_used(self):
         return [
             f"codebuild.start_build_{self.puppet_account_id}_{self.project_name}",
-            f"codebuild.batch_get_projects_{self.puppet_account_id}_{self.project_name}",
         ]
 
     def requires(self):
-        requirements = {
-            "ssm_params": self.get_ssm_parameters(),
-        }
+        requirements = {"ssm_params": self.get_ssm_parameters()}
+        # without parameters there is nothing to match against the project env
+        if self.get_all_of_the_params():
+            requirements["project_environment"] = ProjectEnvironmentDiscoveryTask(
+                manifest_file_path=self.manifest_file_path,
+                puppet_account_id=self.puppet_account_id,
+                project_name=self.project_name,
+            )
         return requirements
 
     def run(self):
-        with self.hub_client("codebuild") as codebuild:
-            provided_parameters = self.get_parameter_values()
-            parameters_to_use = list()
+        provided_parameters = self.get_parameter_values()
+        parameters_to_use = list()
+
+        if provided_parameters:
+            declared_parameters = set(self.load_from_input("project_environment"))
+            for n in sorted(declared_parameters & provided_parameters.keys()):
+                if provided_parameters[n]:
+                    parameters_to_use.append(
+                        {
+                            "name": n,
+                            "value": provided_parameters[n],
+                            "type": "PLAINTEXT",
+                        }
+                    )
 
-            projects = codebuild.batch_get_projects(names=[self.project_name]).get(
-                "projects", []
-            )
-            for project in projects:
-                if project.get("name") == self.project_name:
-                    for environment_variable in project.get("environment", {}).get(
-                        "environmentVariables", []
-                    ):
-                        if environment_variable.get("type") == "PLAINTEXT":
-                            n = environment_variable.get("name")
-                            if provided_parameters.get(n):
-                                parameters_to_use.append(
-                                    dict(
-                                        name=n,
-                                        value=provided_parameters.get(n),
-                                        type="PLAINTEXT",
-                                    )
-                                )
-
-            parameters_to_use.append(
-                dict(name="TARGET_ACCOUNT_ID", value=self.account_id, type="PLAINTEXT",)
-            )
-            parameters_to_use.append(
-                dict(name="TARGET_REGION", value=self.region, type="PLAINTEXT",)
-            )
-            codebuild.start_build_and_wait_for_completion(
+        parameters_to_use.append(
+            {"name": "TARGET_ACCOUNT_ID", "value": self.account_id, "type": "PLAINTEXT"}
+        )
+        parameters_to_use.append(
+            {"name": "TARGET_REGION", "value": self.region, "type": "PLAINTEXT"}
+        )
+        with self.hub_client("codebuild") as codebuild:
+            start_build_and_wait_for_completion(
+                codebuild,
                 projectName=self.project_name,
                 environmentVariablesOverride=parameters_to_use,
             )
@@ -140,12 +230,11 @@ class CodeBuildRunForTask(CodeBuildRunBaseTask, manifest_tasks.ManifestMixen):
     code_build_run_name = luigi.Parameter()
     puppet_account_id = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "code_build_run_name": self.code_build_run_name,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "code_build_run_name",
+        "cache_invalidator",
+    )
 
     def get_klass_for_provisioning(self):
         return ExecuteCodeBuildRunTask
@@ -157,21 +246,14 @@ class CodeBuildRunForTask(CodeBuildRunBaseTask, manifest_tasks.ManifestMixen):
 class CodeBuildRunForRegionTask(CodeBuildRunForTask):
     region = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "code_build_run_name": self.code_build_run_name,
-            "region": self.region,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "code_build_run_name",
+        "region",
+        "cache_invalidator",
+    )
 
     def requires(self):
-        dependencies = list()
-        these_dependencies = list()
-        requirements = dict(
-            dependencies=dependencies, these_dependencies=these_dependencies,
-        )
-
         klass = self.get_klass_for_provisioning()
 
         for task in self.manifest.get_tasks_for_launch_and_region(
@@ -180,28 +262,20 @@ class CodeBuildRunForRegionTask(CodeBuildRunForTask):
             self.code_build_run_name,
             self.region,
         ):
-            dependencies.append(
-                klass(**task, manifest_file_path=self.manifest_file_path)
-            )
-
-        return requirements
+            yield klass(**task, manifest_file_path=self.manifest_file_path)
 
 
 class CodeBuildRunForAccountTask(CodeBuildRunForTask):
     account_id = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "code_build_run_name": self.code_build_run_name,
-            "account_id": self.account_id,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "code_build_run_name",
+        "account_id",
+        "cache_invalidator",
+    )
 
     def requires(self):
-        dependencies = list()
-        requirements = dict(dependencies=dependencies,)
-
         klass = self.get_klass_for_provisioning()
 
         for task in self.manifest.get_tasks_for_launch_and_account(
@@ -210,30 +284,22 @@ class CodeBuildRunForAccountTask(CodeBuildRunForTask):
             self.code_build_run_name,
             self.account_id,
         ):
-            dependencies.append(
-                klass(**task, manifest_file_path=self.manifest_file_path)
-            )
-
-        return requirements
+            yield klass(**task, manifest_file_path=self.manifest_file_path)
 
 
 class CodeBuildRunForAccountAndRegionTask(CodeBuildRunForTask):
     account_id = luigi.Parameter()
     region = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "code_build_run_name": self.code_build_run_name,
-            "region": self.region,
-            "account_id": self.account_id,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "code_build_run_name",
+        "region",
+        "account_id",
+        "cache_invalidator",
+    )
 
     def requires(self):
-        dependencies = list()
-        requirements = dict(dependencies=dependencies)
-
         klass = self.get_klass_for_provisioning()
 
         for task in self.manifest.get_tasks_for_launch_and_account_and_region(
@@ -243,64 +309,38 @@ class CodeBuildRunForAccountAndRegionTask(CodeBuildRunForTask):
             self.account_id,
             self.region,
         ):
-            dependencies.append(
-                klass(**task, manifest_file_path=self.manifest_file_path)
-            )
-
-        return requirements
+            yield klass(**task, manifest_file_path=self.manifest_file_path)
 
 
 class CodeBuildRunTask(CodeBuildRunForTask):
-    code_build_run_name = luigi.Parameter()
-    puppet_account_id = luigi.Parameter()
-
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "code_build_run_name": self.code_build_run_name,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "code_build_run_name",
+        "cache_invalidator",
+    )
 
     def requires(self):
-        requirements = list()
-
         klass = self.get_klass_for_provisioning()
-        for (
-            account_id,
-            regions,
-        ) in self.manifest.get_account_ids_and_regions_used_for_section_item(
-            self.puppet_account_id, self.section_name, self.code_build_run_name
-        ).items():
-            for region in regions:
-                for task in self.manifest.get_tasks_for_launch_and_account_and_region(
-                    self.puppet_account_id,
-                    self.section_name,
-                    self.code_build_run_name,
-                    account_id,
-                    region,
-                ):
-                    requirements.append(
-                        klass(**task, manifest_file_path=self.manifest_file_path)
-                    )
 
-        return requirements
+        for task in self.manifest.get_tasks_for(
+            self.puppet_account_id, self.section_name, self.code_build_run_name
+        ):
+            yield klass(**task, manifest_file_path=self.manifest_file_path)
 
     def run(self):
         self.write_output(self.params_for_results_display())
 
 
 class CodeBuildRunsSectionTask(CodeBuildRunBaseTask, manifest_tasks.SectionTask):
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = ("puppet_account_id", "cache_invalidator")
 
     def requires(self):
-        requirements = list()
-
+        params_base = {
+            "puppet_account_id": sys.intern(self.puppet_account_id),
+            "manifest_file_path": sys.intern(self.manifest_file_path),
+        }
         for name, details in self.manifest.get(constants.CODE_BUILD_RUNS, {}).items():
-            requirements += self.handle_requirements_for(
+            yield from self.handle_requirements_for(
                 name,
                 constants.CODE_BUILD_RUN,
                 constants.CODE_BUILD_RUNS,
@@ -308,14 +348,8 @@ class CodeBuildRunsSectionTask(CodeBuildRunBaseTask, manifest_tasks.SectionTask)
                 CodeBuildRunForAccountTask,
                 CodeBuildRunForAccountAndRegionTask,
                 CodeBuildRunTask,
-                dict(
-                    code_build_run_name=name,
-                    puppet_account_id=self.puppet_account_id,
-                    manifest_file_path=self.manifest_file_path,
-                ),
+                {**params_base, "code_build_run_name": sys.intern(name)},
             )
 
-        return requirements
-
     def run(self):
         self.write_output(self.manifest.get(self.section_name))
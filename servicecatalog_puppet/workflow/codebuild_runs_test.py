@@ -0,0 +1,272 @@
+import json
+from unittest import mock
+
+from . import tasks_unit_tests_helper
+
+
+class GetProjectsTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
+    def setUp(self) -> None:
+        from servicecatalog_puppet.workflow import codebuild_runs
+
+        self.module = codebuild_runs
+        self.codebuild = mock.MagicMock()
+        self.codebuild.batch_get_projects.side_effect = lambda names: {
+            "projects": [{"name": name, "arn": f"arn-{name}"} for name in names]
+        }
+
+    def test_get_projects(self):
+        # setup
+        project_names = ("project-a", "project-b")
+        expected_result = {
+            "project-a": {"name": "project-a", "arn": "arn-project-a"},
+            "project-b": {"name": "project-b", "arn": "arn-project-b"},
+        }
+
+        # exercise
+        actual_result = self.module.get_projects(self.codebuild, project_names)
+
+        # verify
+        self.assertDictEqual(expected_result, actual_result)
+        self.codebuild.batch_get_projects.assert_called_once_with(
+            names=list(project_names)
+        )
+
+    def test_get_projects_in_batches(self):
+        # setup
+        project_names = tuple(f"project-{i}" for i in range(150))
+
+        # exercise
+        actual_result = self.module.get_projects(self.codebuild, project_names)
+
+        # verify
+        self.assertCountEqual(project_names, actual_result)
+        self.assertCountEqual(
+            [
+                mock.call(names=list(project_names[:100])),
+                mock.call(names=list(project_names[100:])),
+            ],
+            self.codebuild.batch_get_projects.call_args_list,
+        )
+
+
+class StartBuildAndWaitForCompletionTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
+    def setUp(self) -> None:
+        from servicecatalog_puppet.workflow import codebuild_runs
+
+        self.module = codebuild_runs
+        self.codebuild = mock.MagicMock()
+
+    def test_start_build_and_wait_for_completion(self):
+        # setup
+        self.codebuild.start_build.return_value = {
+            "build": {"id": "build-id", "buildStatus": "IN_PROGRESS"}
+        }
+        self.codebuild.batch_get_builds.side_effect = [
+            {"builds": [{"id": "build-id", "buildStatus": "IN_PROGRESS"}]},
+            {"builds": [{"id": "build-id", "buildStatus": "SUCCEEDED"}]},
+        ]
+
+        # exercise
+        with mock.patch.object(self.module, "time"), mock.patch.object(
+            self.module, "logger"
+        ) as logger:
+            actual_result = self.module.start_build_and_wait_for_completion(
+                self.codebuild, projectName="project-a"
+            )
+
+        # verify
+        self.assertEqual({"id": "build-id", "buildStatus": "SUCCEEDED"}, actual_result)
+        self.codebuild.start_build.assert_called_once_with(projectName="project-a")
+        self.assertEqual(2, self.codebuild.batch_get_builds.call_count)
+        self.assertEqual(
+            [
+                mock.call("build-id current status: IN_PROGRESS"),
+                mock.call("build-id current status: SUCCEEDED"),
+            ],
+            logger.info.call_args_list,
+        )
+
+
+class BatchGetProjectsTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
+    manifest_file_path = "manifest_file_path"
+    puppet_account_id = "puppet_account_id"
+    project_names = ["project-a", "project-b"]
+
+    def setUp(self) -> None:
+        from servicecatalog_puppet.workflow import codebuild_runs
+
+        self.module = codebuild_runs
+
+        self.sut = self.module.BatchGetProjectsTask(
+            manifest_file_path=self.manifest_file_path,
+            puppet_account_id=self.puppet_account_id,
+            project_names=self.project_names,
+        )
+
+        self.wire_up_mocks()
+
+    def test_params_for_results_display(self):
+        # setup
+        expected_result = {
+            "puppet_account_id": self.puppet_account_id,
+            "cache_invalidator": self.cache_invalidator,
+        }
+
+        # exercise
+        actual_result = self.sut.params_for_results_display()
+
+        # verify
+        self.assertDictEqual(expected_result, actual_result)
+
+    def test_run(self):
+        # setup
+        project_a = {"name": "project-a"}
+        project_b = {"name": "project-b"}
+        self.inject_client_with_response(
+            self.hub_client_mock,
+            "batch_get_projects",
+            {"projects": [project_a, project_b]},
+        )
+
+        # exercise
+        self.sut.run()
+
+        # verify
+        self.sut.hub_client.assert_called_once_with("codebuild")
+        self.hub_client_mock.batch_get_projects.assert_called_once_with(
+            names=self.project_names
+        )
+        self.assert_output({"project-a": project_a, "project-b": project_b})
+
+
+class ProjectEnvironmentDiscoveryTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
+    manifest_file_path = "manifest_file_path"
+    puppet_account_id = "puppet_account_id"
+    project_name = "project-a"
+
+    def setUp(self) -> None:
+        from servicecatalog_puppet.workflow import codebuild_runs
+
+        self.module = codebuild_runs
+
+        self.sut = self.module.ProjectEnvironmentDiscoveryTask(
+            manifest_file_path=self.manifest_file_path,
+            puppet_account_id=self.puppet_account_id,
+            project_name=self.project_name,
+        )
+
+        self.wire_up_mocks()
+
+    def test_params_for_results_display(self):
+        # setup
+        expected_result = {
+            "puppet_account_id": self.puppet_account_id,
+            "project_name": self.project_name,
+            "cache_invalidator": self.cache_invalidator,
+        }
+
+        # exercise
+        actual_result = self.sut.params_for_results_display()
+
+        # verify
+        self.assertDictEqual(expected_result, actual_result)
+
+    def test_run(self):
+        # setup
+        environment_variables = [
+            {"name": "FOO", "value": "foo", "type": "PLAINTEXT"},
+            {"name": "SECRET", "value": "secret", "type": "SECRETS_MANAGER"},
+            {"name": "PARAM", "value": "param", "type": "PARAMETER_STORE"},
+            {"name": "BAR", "value": "bar", "type": "PLAINTEXT"},
+        ]
+        self.inject_into_input(
+            "projects",
+            json.dumps(
+                {
+                    self.project_name: {
+                        "environment": {"environmentVariables": environment_variables}
+                    },
+                    "project-b": {
+                        "environment": {
+                            "environmentVariables": [
+                                {"name": "BAZ", "value": "baz", "type": "PLAINTEXT"}
+                            ]
+                        }
+                    },
+                }
+            ),
+        )
+
+        # exercise
+        self.sut.run()
+
+        # verify
+        self.assert_output(["FOO", "BAR"])
+
+    def test_run_for_an_unknown_project(self):
+        # setup
+        self.inject_into_input("projects", json.dumps({}))
+
+        # exercise
+        self.sut.run()
+
+        # verify
+        self.assert_output([])
+
+
+class DoExecuteCodeBuildRunTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
+    manifest_file_path = "manifest_file_path"
+    code_build_run_name = "code_build_run_name"
+    puppet_account_id = "puppet_account_id"
+    region = "region"
+    account_id = "account_id"
+    project_name = "project-a"
+    requested_priority = 1
+
+    def setUp(self) -> None:
+        from servicecatalog_puppet.workflow import codebuild_runs
+
+        self.module = codebuild_runs
+
+        self.sut = self.module.DoExecuteCodeBuildRunTask(
+            manifest_file_path=self.manifest_file_path,
+            code_build_run_name=self.code_build_run_name,
+            puppet_account_id=self.puppet_account_id,
+            region=self.region,
+            account_id=self.account_id,
+            project_name=self.project_name,
+            requested_priority=self.requested_priority,
+        )
+
+        self.wire_up_mocks()
+
+    def test_run(self):
+        # setup
+        self.sut.get_parameter_values = mock.MagicMock(
+            return_value={"FOO": "foo", "EMPTY": "", "UNDECLARED": "undeclared"}
+        )
+        self.inject_into_input("project_environment", json.dumps(["FOO", "EMPTY"]))
+        self.inject_client_with_response(
+            self.hub_client_mock,
+            "start_build",
+            {"build": {"id": "build-id", "buildStatus": "SUCCEEDED"}},
+        )
+
+        # exercise
+        self.sut.run()
+
+        # verify
+        self.sut.hub_client.assert_called_once_with("codebuild")
+        self.hub_client_mock.start_build.assert_called_once_with(
+            projectName=self.project_name,
+            environmentVariablesOverride=[
+                {"name": "FOO", "value": "foo", "type": "PLAINTEXT"},
+                {
+                    "name": "TARGET_ACCOUNT_ID",
+                    "value": self.account_id,
+                    "type": "PLAINTEXT",
+                },
+                {"name": "TARGET_REGION", "value": self.region, "type": "PLAINTEXT"},
+            ],
+        )
+        self.hub_client_mock.batch_get_builds.assert_not_called()
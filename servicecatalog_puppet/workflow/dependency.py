@@ -1,4 +1,5 @@
 from servicecatalog_puppet import constants
+from servicecatalog_puppet import utils
 
 
 def generate_dependency_tasks(
@@ -196,7 +197,11 @@ def generate_dependency_tasks(
 
 
 class DependenciesMixin(object):
+    @utils.memoize
     def get_section_dependencies(self):
+        return self.resolve_section_dependencies()
+
+    def resolve_section_dependencies(self):
         from servicecatalog_puppet.workflow import codebuild_runs
         from servicecatalog_puppet.workflow import launch
         from servicecatalog_puppet.workflow import spoke_local_portfolios
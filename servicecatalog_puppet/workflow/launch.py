@@ -1,13 +1,16 @@
 import functools
 import json
+from concurrent import futures
 import os
 import time
 
 import luigi
+from botocore import config as botocore_config
 
 from servicecatalog_puppet import aws
 from servicecatalog_puppet import config
 from servicecatalog_puppet import constants
+from servicecatalog_puppet import utils
 from servicecatalog_puppet.workflow import (
     tasks,
     portfoliomanagement as portfoliomanagement_tasks,
@@ -16,64 +19,124 @@ from servicecatalog_puppet.workflow import (
     generate,
 )
 
+DESCRIBE_PROVISIONING_PARAMETERS_S3_RETRIES = 3
+DESCRIBE_PROVISIONING_PARAMETERS_S3_RETRY_DELAY_IN_SECONDS = 3
+
+RETRYING_CLIENT_CONFIG = botocore_config.Config(
+    retries={"mode": "adaptive", "max_attempts": 4}
+)
+
+SSM_PARAM_OUTPUTS_MAX_WORKERS = 3
+SSM_DELETE_PARAMETERS_MAX_NAMES = 10
+UPDATE_PROVISIONED_PRODUCT_OWNER_MAX_WORKERS = 8
+
+LIST_LAUNCH_PATHS_API_CALLS = ("servicecatalog.list_launch_paths",)
+
+DESCRIBE_PROVISIONING_PARAMETERS_API_CALLS = (
+    "servicecatalog.describe_provisioning_parameters",
+)
+
+PROVISION_PRODUCT_API_CALLS = (
+    "servicecatalog.scan_provisioned_products_single_page",
+    "servicecatalog.describe_provisioned_product",
+    "servicecatalog.terminate_provisioned_product",
+    "servicecatalog.describe_record",
+    "cloudformation.get_template_summary",
+    "cloudformation.describe_stacks",
+    "servicecatalog.list_provisioned_product_plans_single_page",
+    "servicecatalog.delete_provisioned_product_plan",
+    "servicecatalog.create_provisioned_product_plan",
+    "servicecatalog.describe_provisioned_product_plan",
+    "servicecatalog.execute_provisioned_product_plan",
+    "servicecatalog.describe_provisioned_product",
+    "servicecatalog.update_provisioned_product",
+    "servicecatalog.provision_product",
+    # "ssm.put_parameter_and_wait",
+)
+
+PROVISION_PRODUCT_WITH_PLANS_API_CALLS = (
+    PROVISION_PRODUCT_API_CALLS + LIST_LAUNCH_PATHS_API_CALLS
+)
+
+PROVISION_PRODUCT_DRY_RUN_API_CALLS = (
+    "servicecatalog.scan_provisioned_products_single_page",
+    "servicecatalog.list_launch_paths",
+    "servicecatalog.describe_provisioning_artifact",
+    "cloudformation.describe_provisioning_artifact",
+    "cloudformation.get_template_summary",
+    "cloudformation.describe_stacks",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_api_calls_used(api_calls, account_id, region):
+    return tuple(f"{api_call}_{account_id}_{region}" for api_call in api_calls)
+
+
+@functools.lru_cache(maxsize=None)
+def get_spoke_execution_dependency_klasses():
+    from servicecatalog_puppet.workflow import codebuild_runs
+    from servicecatalog_puppet.workflow import spoke_local_portfolios
+    from servicecatalog_puppet.workflow import assertions
+    from servicecatalog_puppet.workflow import lambda_invocations
+
+    # spoke executions can only depend on whole items so the affinity must match
+    return {
+        constants.LAUNCH: (LaunchTask, "launch_name", "a launch using affinity launch"),
+        constants.SPOKE_LOCAL_PORTFOLIO: (
+            spoke_local_portfolios.SpokeLocalPortfolioTask,
+            "spoke_local_portfolio_name",
+            "a spoke_local_portfolio using affinity spoke_local_portfolios",
+        ),
+        constants.ASSERTION: (
+            assertions.AssertionTask,
+            "assertion_name",
+            "an assertion using affinity assertion",
+        ),
+        constants.CODE_BUILD_RUN: (
+            codebuild_runs.CodeBuildRunTask,
+            "code_build_run_name",
+            "a code_build_run using affinity code_build_run",
+        ),
+        constants.LAMBDA_INVOCATION: (
+            lambda_invocations.LambdaInvocationTask,
+            "lambda_invocation_name",
+            "a lambda_invocation using affinity lambda_invocation",
+        ),
+    }
+
 
 class LaunchSectionTask(manifest_tasks.SectionTask):
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = ("puppet_account_id", "cache_invalidator")
 
     def requires(self):
         self.info(f"Launching and execution mode is: {self.execution_mode}")
         requirements = list()
+        running_in_spoke = self.is_running_in_spoke()
 
         for name, details in self.manifest.get(constants.LAUNCHES, {}).items():
-            execution = details.get("execution")
-
-            if self.is_running_in_spoke():
-                if execution == constants.EXECUTION_MODE_SPOKE:
-                    requirements += self.handle_requirements_for(
-                        name,
-                        constants.LAUNCH,
-                        constants.LAUNCHES,
-                        LaunchForRegionTask,
-                        LaunchForAccountTask,
-                        LaunchForAccountAndRegionTask,
-                        LaunchTask,
-                        dict(
-                            launch_name=name,
-                            puppet_account_id=self.puppet_account_id,
-                            manifest_file_path=self.manifest_file_path,
-                        ),
-                    )
-                else:
-                    continue
-
-            else:
-                if execution != constants.EXECUTION_MODE_SPOKE:
-                    requirements += self.handle_requirements_for(
-                        name,
-                        constants.LAUNCH,
-                        constants.LAUNCHES,
-                        LaunchForRegionTask,
-                        LaunchForAccountTask,
-                        LaunchForAccountAndRegionTask,
-                        LaunchTask,
-                        dict(
-                            launch_name=name,
-                            puppet_account_id=self.puppet_account_id,
-                            manifest_file_path=self.manifest_file_path,
-                        ),
-                    )
-                else:
-                    requirements.append(
-                        LaunchForSpokeExecutionTask(
-                            launch_name=name,
-                            puppet_account_id=self.puppet_account_id,
-                            manifest_file_path=self.manifest_file_path,
-                        )
-                    )
+            is_spoke_execution = (
+                details.get("execution") == constants.EXECUTION_MODE_SPOKE
+            )
+            params = {
+                "launch_name": name,
+                "puppet_account_id": self.puppet_account_id,
+                "manifest_file_path": self.manifest_file_path,
+            }
+
+            if is_spoke_execution == running_in_spoke:
+                requirements += self.handle_requirements_for(
+                    name,
+                    constants.LAUNCH,
+                    constants.LAUNCHES,
+                    LaunchForRegionTask,
+                    LaunchForAccountTask,
+                    LaunchForAccountAndRegionTask,
+                    LaunchTask,
+                    params,
+                )
+            elif is_spoke_execution:
+                requirements.append(LaunchForSpokeExecutionTask(**params))
 
         return requirements
 
@@ -84,6 +147,10 @@ class LaunchSectionTask(manifest_tasks.SectionTask):
 class ProvisioningTask(tasks.PuppetTaskWithParameters, manifest_tasks.ManifestMixen):
     manifest_file_path = luigi.Parameter()
 
+    @utils.memoize
+    def __repr__(self):
+        return super().__repr__()
+
     @property
     def status(self):
         return (
@@ -96,6 +163,14 @@ class ProvisioningTask(tasks.PuppetTaskWithParameters, manifest_tasks.ManifestMi
     def section_name(self):
         return constants.LAUNCHES
 
+    def get_params_to_use(self, provisioning_artifact_parameters, all_params):
+        return {
+            p.get("ParameterKey"): all_params.get(
+                p.get("ParameterKey"), p.get("DefaultValue")
+            )
+            for p in provisioning_artifact_parameters
+        }
+
 
 class ListLaunchPathsTask(ProvisioningTask):
     puppet_account_id = luigi.Parameter()
@@ -105,37 +180,45 @@ class ListLaunchPathsTask(ProvisioningTask):
     region = luigi.Parameter()
 
     def api_calls_used(self):
-        return [
-            f"servicecatalog.list_launch_paths_{self.account_id}_{self.region}",
-        ]
+        return list(
+            get_api_calls_used(
+                LIST_LAUNCH_PATHS_API_CALLS, self.account_id, self.region
+            )
+        )
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "portfolio": self.portfolio,
-            "region": self.region,
-            "product_id": self.product_id,
-            "account_id": self.account_id,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "portfolio",
+        "region",
+        "product_id",
+        "account_id",
+        "cache_invalidator",
+    )
 
     def run(self):
         with self.hub_regional_client("servicecatalog") as service_catalog:
             self.info(f"Getting path for product {self.product_id}")
             response = service_catalog.list_launch_paths(ProductId=self.product_id)
-            if len(response.get("LaunchPathSummaries")) == 1:
-                path_id = response.get("LaunchPathSummaries")[0].get("Id")
+            launch_path_summaries = response.get("LaunchPathSummaries", [])
+            if len(launch_path_summaries) == 1:
+                path_id = launch_path_summaries[0].get("Id")
                 self.info(
                     f"There is only one path: {path_id} for product: {self.product_id}"
                 )
-                self.write_output(response.get("LaunchPathSummaries")[0])
-            else:
-                for launch_path_summary in response.get("LaunchPathSummaries", []):
-                    name = launch_path_summary.get("Name")
-                    if name == self.portfolio:
-                        path_id = launch_path_summary.get("Id")
-                        self.info(f"Got path: {path_id} for product: {self.product_id}")
-                        self.write_output(launch_path_summary)
+                self.write_output(launch_path_summaries[0])
+                return
+
+            # portfolio names are not unique so keep the first path for each name
+            launch_path_summaries_by_name = {
+                launch_path_summary.get("Name"): launch_path_summary
+                for launch_path_summary in reversed(launch_path_summaries)
+            }
+            launch_path_summary = launch_path_summaries_by_name.get(self.portfolio)
+            if launch_path_summary is not None:
+                path_id = launch_path_summary.get("Id")
+                self.info(f"Got path: {path_id} for product: {self.product_id}")
+                self.write_output(launch_path_summary)
+                return
         raise Exception("Could not find a launch path")
 
 
@@ -150,30 +233,75 @@ class ProvisioningArtifactParametersTask(ProvisioningTask):
     def retry_count(self):
         return 5
 
-    def params_for_results_display(self):
+    results_display_keys = (
+        "puppet_account_id",
+        "portfolio",
+        "region",
+        "product",
+        "version",
+        "cache_invalidator",
+    )
+
+    def requires(self):
         return {
-            "puppet_account_id": self.puppet_account_id,
-            "portfolio": self.portfolio,
-            "region": self.region,
-            "product": self.product,
-            "version": self.version,
-            "cache_invalidator": self.cache_invalidator,
+            "parameters": DoDescribeProvisioningParameters(
+                manifest_file_path=self.manifest_file_path,
+                puppet_account_id=self.puppet_account_id,
+                account_id=self.single_account
+                if self.execution_mode == constants.EXECUTION_MODE_SPOKE
+                else self.puppet_account_id,
+                region=self.region,
+                portfolio=self.portfolio,
+                product=self.product,
+                version=self.version,
+            ),
         }
 
+    def run(self):
+        self.write_output(
+            self.read_from_input("parameters"), skip_json_dump=True,
+        )
+
+
+class DoDescribeProvisioningParameters(ProvisioningTask):
+    puppet_account_id = luigi.Parameter()
+    account_id = luigi.Parameter()
+    region = luigi.Parameter()
+    portfolio = luigi.Parameter()
+    product = luigi.Parameter()
+    version = luigi.Parameter()
+
+    # no cache_invalidator so the output can be cached across runs
+    results_display_keys = (
+        "puppet_account_id",
+        "account_id",
+        "portfolio",
+        "region",
+        "product",
+        "version",
+    )
+
+    def api_calls_used(self):
+        return list(
+            get_api_calls_used(
+                DESCRIBE_PROVISIONING_PARAMETERS_API_CALLS,
+                self.account_id,
+                self.region,
+            )
+        )
+
     def requires(self):
-        required = dict(
-            details=portfoliomanagement_tasks.GetVersionDetailsByNames(
+        required = {
+            "details": portfoliomanagement_tasks.GetVersionDetailsByNames(
                 manifest_file_path=self.manifest_file_path,
                 puppet_account_id=self.puppet_account_id,
                 portfolio=self.portfolio,
                 product=self.product,
                 version=self.version,
-                account_id=self.single_account
-                if self.execution_mode == constants.EXECUTION_MODE_SPOKE
-                else self.puppet_account_id,
+                account_id=self.account_id,
                 region=self.region,
             ),
-        )
+        }
         if self.execution_mode != constants.EXECUTION_MODE_SPOKE:
             required[
                 "associations"
@@ -190,71 +318,33 @@ class ProvisioningArtifactParametersTask(ProvisioningTask):
         details = self.load_from_input("details")
         product_id = details.get("product_details").get("ProductId")
         version_id = details.get("version_details").get("Id")
-        result = yield DoDescribeProvisioningParameters(
-            manifest_file_path=self.manifest_file_path,
-            puppet_account_id=self.single_account
-            if self.execution_mode == constants.EXECUTION_MODE_SPOKE
-            else self.puppet_account_id,
-            region=self.region,
-            product_id=product_id,
-            version_id=version_id,
-            portfolio=self.portfolio,
-        )
-        self.write_output(
-            result.open("r").read(), skip_json_dump=True,
-        )
 
+        with self.hub_regional_client(
+            "servicecatalog", account_id=self.account_id, config=RETRYING_CLIENT_CONFIG
+        ) as service_catalog:
 
-class DoDescribeProvisioningParameters(ProvisioningTask):
-    puppet_account_id = luigi.Parameter()
-    region = luigi.Parameter()
-    product_id = luigi.Parameter()
-    version_id = luigi.Parameter()
-    portfolio = luigi.Parameter()
-
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "portfolio": self.portfolio,
-            "region": self.region,
-            "product_id": self.product_id,
-            "version_id": self.version_id,
-        }
-
-    def api_calls_used(self):
-        return [
-            f"servicecatalog.describe_provisioning_parameters_{self.puppet_account_id}_{self.region}",
-        ]
-
-    def run(self):
-        with self.hub_regional_client("servicecatalog") as service_catalog:
-
-            provisioning_artifact_parameters = None
-            retries = 3
-            while retries > 0:
+            retries = DESCRIBE_PROVISIONING_PARAMETERS_S3_RETRIES
+            while True:
                 try:
                     provisioning_artifact_parameters = service_catalog.describe_provisioning_parameters(
-                        ProductId=self.product_id,
-                        ProvisioningArtifactId=self.version_id,
+                        ProductId=product_id,
+                        ProvisioningArtifactId=version_id,
                         PathName=self.portfolio,
                     ).get(
                         "ProvisioningArtifactParameters", []
                     )
-                    retries = 0
                     break
                 except service_catalog.exceptions.ClientError as ex:
-                    if "S3 error: Access Denied" in str(ex):
-                        self.info("Swallowing S3 error: Access Denied")
-                    else:
-                        raise ex
-                    time.sleep(3)
+                    # not retried by botocore, the template is not readable yet
                     retries -= 1
+                    if "S3 error: Access Denied" not in str(ex) or retries == 0:
+                        raise ex
+                    self.info("S3 error: Access Denied, retrying")
+                    time.sleep(
+                        DESCRIBE_PROVISIONING_PARAMETERS_S3_RETRY_DELAY_IN_SECONDS
+                    )
 
-            self.write_output(
-                provisioning_artifact_parameters
-                if isinstance(provisioning_artifact_parameters, list)
-                else [provisioning_artifact_parameters]
-            )
+            self.write_output(provisioning_artifact_parameters)
 
 
 class ProvisionProductTask(ProvisioningTask, dependency.DependenciesMixin):
@@ -283,14 +373,13 @@ class ProvisionProductTask(ProvisioningTask, dependency.DependenciesMixin):
 
     try_count = 1
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "launch_name": self.launch_name,
-            "account_id": self.account_id,
-            "region": self.region,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "launch_name",
+        "account_id",
+        "region",
+        "cache_invalidator",
+    )
 
     @property
     def priority(self):
@@ -323,28 +412,15 @@ class ProvisionProductTask(ProvisioningTask, dependency.DependenciesMixin):
         return requirements
 
     def api_calls_used(self):
-        apis = [
-            f"servicecatalog.scan_provisioned_products_single_page_{self.account_id}_{self.region}",
-            f"servicecatalog.describe_provisioned_product_{self.account_id}_{self.region}",
-            f"servicecatalog.terminate_provisioned_product_{self.account_id}_{self.region}",
-            f"servicecatalog.describe_record_{self.account_id}_{self.region}",
-            f"cloudformation.get_template_summary_{self.account_id}_{self.region}",
-            f"cloudformation.describe_stacks_{self.account_id}_{self.region}",
-            f"servicecatalog.list_provisioned_product_plans_single_page_{self.account_id}_{self.region}",
-            f"servicecatalog.delete_provisioned_product_plan_{self.account_id}_{self.region}",
-            f"servicecatalog.create_provisioned_product_plan_{self.account_id}_{self.region}",
-            f"servicecatalog.describe_provisioned_product_plan_{self.account_id}_{self.region}",
-            f"servicecatalog.execute_provisioned_product_plan_{self.account_id}_{self.region}",
-            f"servicecatalog.describe_provisioned_product_{self.account_id}_{self.region}",
-            f"servicecatalog.update_provisioned_product_{self.account_id}_{self.region}",
-            f"servicecatalog.provision_product_{self.account_id}_{self.region}",
-            # f"ssm.put_parameter_and_wait_{self.region}",
-        ]
-        if self.should_use_product_plans:
-            apis.append(
-                f"servicecatalog.list_launch_paths_{self.account_id}_{self.region}",
+        return list(
+            get_api_calls_used(
+                PROVISION_PRODUCT_WITH_PLANS_API_CALLS
+                if self.should_use_product_plans
+                else PROVISION_PRODUCT_API_CALLS,
+                self.account_id,
+                self.region,
             )
-        return apis
+        )
 
     def run(self):
         details = self.load_from_input("details")
@@ -353,9 +429,9 @@ class ProvisionProductTask(ProvisioningTask, dependency.DependenciesMixin):
 
         task_output = dict(
             **self.params_for_results_display(),
-            account_parameters=tasks.unwrap(self.account_parameters),
-            launch_parameters=tasks.unwrap(self.launch_parameters),
-            manifest_parameters=tasks.unwrap(self.manifest_parameters),
+            account_parameters=self.get_unwrapped("account_parameters"),
+            launch_parameters=self.get_unwrapped("launch_parameters"),
+            manifest_parameters=self.get_unwrapped("manifest_parameters"),
         )
 
         all_params = self.get_parameter_values()
@@ -377,108 +453,89 @@ class ProvisionProductTask(ProvisioningTask, dependency.DependenciesMixin):
             self.info(
                 f"pp_id: {provisioned_product_id}, paid : {provisioning_artifact_id}"
             )
+            stack_name = f"SC-{self.account_id}-{provisioned_product_id}"
 
-            with self.spoke_regional_client("cloudformation") as cloudformation:
-                need_to_provision = True
+            cloudformation = self.cached_spoke_regional_client("cloudformation")
+            need_to_provision = True
 
-                self.info(
-                    f"running ,checking {product_id} {version_id} {path_name} in {self.account_id} {self.region}"
-                )
+            self.info(
+                f"running ,checking {product_id} {version_id} {path_name} in {self.account_id} {self.region}"
+            )
 
-                with self.input().get("provisioning_artifact_parameters").open(
-                    "r"
-                ) as f:
-                    provisioning_artifact_parameters = json.loads(f.read())
+            provisioning_artifact_parameters = self.load_from_input(
+                "provisioning_artifact_parameters"
+            )
 
-                params_to_use = {}
-                for p in provisioning_artifact_parameters:
-                    param_name = p.get("ParameterKey")
-                    params_to_use[param_name] = all_params.get(
-                        param_name, p.get("DefaultValue")
-                    )
+            params_to_use = self.get_params_to_use(
+                provisioning_artifact_parameters, all_params
+            )
 
-                if provisioning_artifact_id == version_id:
-                    self.info(f"found previous good provision")
-                    if provisioned_product_id:
-                        self.info(f"checking params for diffs")
-                        provisioned_parameters = aws.get_parameters_for_stack(
-                            cloudformation,
-                            f"SC-{self.account_id}-{provisioned_product_id}",
-                        )
-                        self.info(f"current params: {provisioned_parameters}")
+            stack = None
+            if provisioning_artifact_id == version_id:
+                self.info(f"found previous good provision")
+                if provisioned_product_id:
+                    self.info(f"checking params for diffs")
+                    stack = aws.get_stack_output_for(cloudformation, stack_name)
+                    provisioned_parameters = aws.get_parameters_for_stack(
+                        cloudformation, stack_name, stack
+                    )
+                    self.info(f"current params: {provisioned_parameters}")
 
-                        self.info(f"new params: {params_to_use}")
+                    self.info(f"new params: {params_to_use}")
 
-                        if provisioned_parameters == params_to_use:
-                            self.info(f"params unchanged")
-                            need_to_provision = False
-                        else:
-                            self.info(f"params changed")
+                    if provisioned_parameters == params_to_use:
+                        self.info(f"params unchanged")
+                        need_to_provision = False
+                    else:
+                        self.info(f"params changed")
 
-                if provisioned_product_status == "TAINTED":
-                    need_to_provision = True
+            if provisioned_product_status == "TAINTED":
+                need_to_provision = True
 
-                if need_to_provision:
-                    self.info(
-                        f"about to provision with params: {json.dumps(tasks.unwrap(params_to_use))}"
-                    )
+            if need_to_provision:
+                self.info(
+                    f"about to provision with params: {json.dumps(tasks.unwrap(params_to_use))}"
+                )
 
-                    if provisioned_product_id:
-                        stack = aws.get_stack_output_for(
-                            cloudformation,
-                            f"SC-{self.account_id}-{provisioned_product_id}",
+                if provisioned_product_id:
+                    if stack is None:
+                        stack = aws.get_stack_output_for(cloudformation, stack_name)
+                    stack_status = stack.get("StackStatus")
+                    self.info(f"current cfn stack_status is {stack_status}")
+                    if stack_status not in [
+                        "UPDATE_COMPLETE",
+                        "CREATE_COMPLETE",
+                        "UPDATE_ROLLBACK_COMPLETE",
+                    ]:
+                        raise Exception(
+                            f"[{self.uid}] current cfn stack_status is {stack_status}"
+                        )
+                    if stack_status == "UPDATE_ROLLBACK_COMPLETE":
+                        self.warning(
+                            f"[{self.uid}] {stack_name} has a status of "
+                            f"{stack_status}.  This may need manual resolution."
                         )
-                        stack_status = stack.get("StackStatus")
-                        self.info(f"current cfn stack_status is {stack_status}")
-                        if stack_status not in [
-                            "UPDATE_COMPLETE",
-                            "CREATE_COMPLETE",
-                            "UPDATE_ROLLBACK_COMPLETE",
-                        ]:
-                            raise Exception(
-                                f"[{self.uid}] current cfn stack_status is {stack_status}"
-                            )
-                        if stack_status == "UPDATE_ROLLBACK_COMPLETE":
-                            self.warning(
-                                f"[{self.uid}] SC-{self.account_id}-{provisioned_product_id} has a status of "
-                                f"{stack_status}.  This may need manual resolution."
-                            )
-
-                    if provisioned_product_id:
-                        if self.should_use_product_plans:
-                            path_id = aws.get_path_for_product(
-                                service_catalog, product_id, self.portfolio
-                            )
-                            provisioned_product_id = aws.provision_product_with_plan(
-                                service_catalog,
-                                self.launch_name,
-                                self.account_id,
-                                self.region,
-                                product_id,
-                                version_id,
-                                self.puppet_account_id,
-                                path_id,
-                                params_to_use,
-                                self.version,
-                                self.should_use_sns,
-                            )
-                        else:
-                            provisioned_product_id = aws.update_provisioned_product(
-                                service_catalog,
-                                self.launch_name,
-                                self.account_id,
-                                self.region,
-                                product_id,
-                                version_id,
-                                self.puppet_account_id,
-                                path_name,
-                                params_to_use,
-                                self.version,
-                                self.execution,
-                            )
 
+                if provisioned_product_id:
+                    if self.should_use_product_plans:
+                        path_id = aws.get_path_for_product(
+                            service_catalog, product_id, self.portfolio
+                        )
+                        provisioned_product_id = aws.provision_product_with_plan(
+                            service_catalog,
+                            self.launch_name,
+                            self.account_id,
+                            self.region,
+                            product_id,
+                            version_id,
+                            self.puppet_account_id,
+                            path_id,
+                            params_to_use,
+                            self.version,
+                            self.should_use_sns,
+                        )
                     else:
-                        provisioned_product_id = aws.provision_product(
+                        provisioned_product_id = aws.update_provisioned_product(
                             service_catalog,
                             self.launch_name,
                             self.account_id,
@@ -489,62 +546,88 @@ class ProvisionProductTask(ProvisioningTask, dependency.DependenciesMixin):
                             path_name,
                             params_to_use,
                             self.version,
-                            self.should_use_sns,
                             self.execution,
                         )
 
-                self.info(f"self.execution is {self.execution}")
-                if self.execution == constants.EXECUTION_MODE_HUB:
+                else:
+                    provisioned_product_id = aws.provision_product(
+                        service_catalog,
+                        self.launch_name,
+                        self.account_id,
+                        self.region,
+                        product_id,
+                        version_id,
+                        self.puppet_account_id,
+                        path_name,
+                        params_to_use,
+                        self.version,
+                        self.should_use_sns,
+                        self.execution,
+                    )
+
+            self.info(f"self.execution is {self.execution}")
+            if (
+                self.execution == constants.EXECUTION_MODE_HUB
+                and self.ssm_param_outputs
+            ):
+                self.info(
+                    f"Running in execution mode: {self.execution}, checking for SSM outputs"
+                )
+                # fetched again as provisioning may have outlived the credentials
+                cloudformation = self.cached_spoke_regional_client("cloudformation")
+                stack_details = aws.get_stack_output_for(
+                    cloudformation, f"SC-{self.account_id}-{provisioned_product_id}",
+                )
+
+                outputs_by_key = {
+                    output.get("OutputKey"): output.get("OutputValue")
+                    for output in stack_details.get("Outputs", [])
+                }
+                ssm_params_to_put = list()
+                for ssm_param_output in self.ssm_param_outputs:
                     self.info(
-                        f"Running in execution mode: {self.execution}, checking for SSM outputs"
+                        f"writing SSM Param: {ssm_param_output.get('stack_output')}"
                     )
-                    with self.spoke_regional_client(
-                        "cloudformation"
-                    ) as spoke_cloudformation:
-                        stack_details = aws.get_stack_output_for(
-                            spoke_cloudformation,
-                            f"SC-{self.account_id}-{provisioned_product_id}",
+                    # TODO push into another task
+                    if ssm_param_output.get("stack_output") not in outputs_by_key:
+                        raise Exception(
+                            f"[{self.uid}] Could not find match for {ssm_param_output.get('stack_output')}"
                         )
+                    ssm_parameter_name = utils.replace_aws_placeholders(
+                        ssm_param_output.get("param_name"),
+                        self.account_id,
+                        self.region,
+                    )
+                    self.info(f"found value")
+                    ssm_params_to_put.append(
+                        dict(
+                            Name=ssm_parameter_name,
+                            Value=outputs_by_key.get(
+                                ssm_param_output.get("stack_output")
+                            ),
+                            Type=ssm_param_output.get("param_type", "String"),
+                            Overwrite=True,
+                        )
+                    )
 
-                    for ssm_param_output in self.ssm_param_outputs:
-                        self.info(
-                            f"writing SSM Param: {ssm_param_output.get('stack_output')}"
+                if ssm_params_to_put:
+                    ssm = self.cached_hub_client("ssm", config=RETRYING_CLIENT_CONFIG)
+                    with futures.ThreadPoolExecutor(
+                        max_workers=min(
+                            len(ssm_params_to_put), SSM_PARAM_OUTPUTS_MAX_WORKERS,
+                        )
+                    ) as executor:
+                        list(
+                            executor.map(
+                                lambda ssm_param: ssm.put_parameter_and_wait(
+                                    **ssm_param
+                                ),
+                                ssm_params_to_put,
+                            )
                         )
-                        with self.hub_client("ssm") as ssm:
-                            found_match = False
-                            # TODO push into another task
-                            for output in stack_details.get("Outputs", []):
-                                if output.get("OutputKey") == ssm_param_output.get(
-                                    "stack_output"
-                                ):
-                                    ssm_parameter_name = ssm_param_output.get(
-                                        "param_name"
-                                    )
-                                    ssm_parameter_name = ssm_parameter_name.replace(
-                                        "${AWS::Region}", self.region
-                                    )
-                                    ssm_parameter_name = ssm_parameter_name.replace(
-                                        "${AWS::AccountId}", self.account_id
-                                    )
-                                    found_match = True
-                                    self.info(f"found value")
-                                    ssm.put_parameter_and_wait(
-                                        Name=ssm_parameter_name,
-                                        Value=output.get("OutputValue"),
-                                        Type=ssm_param_output.get(
-                                            "param_type", "String"
-                                        ),
-                                        Overwrite=True,
-                                    )
-                            if not found_match:
-                                raise Exception(
-                                    f"[{self.uid}] Could not find match for {ssm_param_output.get('stack_output')}"
-                                )
 
-                    self.write_output(task_output)
-                else:
-                    self.write_output(task_output)
-                self.info("finished")
+            self.write_output(task_output)
+            self.info("finished")
 
 
 class ProvisionProductDryRunTask(ProvisionProductTask):
@@ -556,14 +639,11 @@ class ProvisionProductDryRunTask(ProvisionProductTask):
         return f"output/{self.uid}.{self.output_suffix}"
 
     def api_calls_used(self):
-        return [
-            f"servicecatalog.scan_provisioned_products_single_page_{self.account_id}_{self.region}",
-            f"servicecatalog.list_launch_paths_{self.account_id}_{self.region}",
-            f"servicecatalog.describe_provisioning_artifact_{self.account_id}_{self.region}",
-            f"cloudformation.describe_provisioning_artifact_{self.account_id}_{self.region}",
-            f"cloudformation.get_template_summary_{self.account_id}_{self.region}",
-            f"cloudformation.describe_stacks_{self.account_id}_{self.region}",
-        ]
+        return list(
+            get_api_calls_used(
+                PROVISION_PRODUCT_DRY_RUN_API_CALLS, self.account_id, self.region
+            )
+        )
 
     def run(self):
         details = self.load_from_input("details")
@@ -590,6 +670,7 @@ class ProvisionProductDryRunTask(ProvisionProductTask):
                     if current_status in ["AVAILABLE", "TAINTED"]:
                         provisioned_product_id = r.get("Id")
                         provisioning_artifact_id = r.get("ProvisioningArtifactId")
+                    break
 
             if provisioning_artifact_id is None:
                 self.info(f"params unchanged")
@@ -614,17 +695,13 @@ class ProvisionProductDryRunTask(ProvisionProductTask):
                         f"checking {product_id} {version_id} {path_name} in {self.account_id} {self.region}"
                     )
 
-                    with self.input().get("provisioning_artifact_parameters").open(
-                        "r"
-                    ) as f:
-                        provisioning_artifact_parameters = json.loads(f.read())
+                    provisioning_artifact_parameters = self.load_from_input(
+                        "provisioning_artifact_parameters"
+                    )
 
-                    params_to_use = {}
-                    for p in provisioning_artifact_parameters:
-                        param_name = p.get("ParameterKey")
-                        params_to_use[param_name] = all_params.get(
-                            param_name, p.get("DefaultValue")
-                        )
+                    params_to_use = self.get_params_to_use(
+                        provisioning_artifact_parameters, all_params
+                    )
 
                     if provisioning_artifact_id == version_id:
                         self.info(f"found previous good provision")
@@ -694,7 +771,6 @@ class ProvisionProductDryRunTask(ProvisionProductTask):
                         "notes": notes,
                         "params": self.param_kwargs,
                     },
-                    indent=4,
                     default=str,
                 )
             )
@@ -726,14 +802,13 @@ class TerminateProductTask(ProvisioningTask, dependency.DependenciesMixin):
 
     try_count = 1
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "launch_name": self.launch_name,
-            "account_id": self.account_id,
-            "region": self.region,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "launch_name",
+        "account_id",
+        "region",
+        "cache_invalidator",
+    )
 
     def requires(self):
         requirements = {"section_dependencies": self.get_section_dependencies()}
@@ -789,14 +864,13 @@ class DoTerminateProductTask(ProvisioningTask, dependency.DependenciesMixin):
 
     try_count = 1
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "launch_name": self.launch_name,
-            "account_id": self.account_id,
-            "region": self.region,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "launch_name",
+        "account_id",
+        "region",
+        "cache_invalidator",
+    )
 
     def requires(self):
         requirements = {
@@ -820,18 +894,17 @@ class DoTerminateProductTask(ProvisioningTask, dependency.DependenciesMixin):
             f"servicecatalog.scan_provisioned_products_single_page{self.account_id}_{self.region}",
             f"servicecatalog.terminate_provisioned_product_{self.account_id}_{self.region}",
             f"servicecatalog.describe_record_{self.account_id}_{self.region}",
-            # f"ssm.delete_parameter_{self.region}": 1,
+            # f"ssm.delete_parameters_{self.region}": 1,
         ]
 
     def run(self):
         self.info(f"starting terminate try {self.try_count} of {self.retry_count}")
+        prefix = f"[{self.launch_name}] {self.account_id}:{self.region}"
         details = self.load_from_input("details")
         product_id = details.get("product_details").get("ProductId")
 
         with self.spoke_regional_client("servicecatalog") as service_catalog:
-            self.info(
-                f"[{self.launch_name}] {self.account_id}:{self.region} :: looking for previous failures"
-            )
+            self.info(f"{prefix} :: looking for previous failures")
             provisioned_product_id, provisioning_artifact_id = aws.ensure_is_terminated(
                 service_catalog, self.launch_name, product_id
             )
@@ -840,29 +913,36 @@ class DoTerminateProductTask(ProvisioningTask, dependency.DependenciesMixin):
                 {"provisioned_product_id": provisioned_product_id,}
             )
 
-            for ssm_param_output in self.ssm_param_outputs:
-                param_name = ssm_param_output.get("param_name")
-                self.info(
-                    f"[{self.launch_name}] {self.account_id}:{self.region} :: deleting SSM Param: {param_name}"
-                )
+            param_names = [
+                ssm_param_output.get("param_name")
+                for ssm_param_output in self.ssm_param_outputs
+            ]
+            batches = [
+                param_names[i : i + SSM_DELETE_PARAMETERS_MAX_NAMES]
+                for i in range(0, len(param_names), SSM_DELETE_PARAMETERS_MAX_NAMES)
+            ]
+            if batches:
+                for param_name in param_names:
+                    self.info(f"{prefix} :: deleting SSM Param: {param_name}")
                 with self.hub_client("ssm") as ssm:
-                    try:
-                        # todo push into another task
-                        ssm.delete_parameter(Name=param_name,)
-                        self.info(
-                            f"[{self.launch_name}] {self.account_id}:{self.region} :: deleting SSM Param: {param_name}"
-                        )
-                    except ssm.exceptions.ParameterNotFound:
-                        self.info(
-                            f"[{self.launch_name}] {self.account_id}:{self.region} :: SSM Param: {param_name} not found"
+                    # todo push into another task
+                    with futures.ThreadPoolExecutor(
+                        max_workers=min(len(batches), SSM_PARAM_OUTPUTS_MAX_WORKERS)
+                    ) as executor:
+                        responses = list(
+                            executor.map(
+                                lambda names: ssm.delete_parameters(Names=names),
+                                batches,
+                            )
                         )
+                for response in responses:
+                    for param_name in response.get("InvalidParameters", []):
+                        self.info(f"{prefix} :: SSM Param: {param_name} not found")
 
             with self.output().open("w") as f:
-                f.write(json.dumps(log_output, indent=4, default=str,))
+                f.write(json.dumps(log_output, default=str,))
 
-            self.info(
-                f"[{self.launch_name}] {self.account_id}:{self.region} :: finished terminating"
-            )
+            self.info(f"{prefix} :: finished terminating")
 
 
 class TerminateProductDryRunTask(ProvisioningTask):
@@ -889,14 +969,13 @@ class TerminateProductDryRunTask(ProvisioningTask):
 
     try_count = 1
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "launch_name": self.launch_name,
-            "account_id": self.account_id,
-            "region": self.region,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "launch_name",
+        "account_id",
+        "region",
+        "cache_invalidator",
+    )
 
     def write_result(self, current_version, new_version, effect, notes=""):
         with self.output().open("w") as f:
@@ -909,7 +988,6 @@ class TerminateProductDryRunTask(ProvisioningTask):
                         "notes": notes,
                         "params": self.param_kwargs,
                     },
-                    indent=4,
                     default=str,
                 )
             )
@@ -924,11 +1002,10 @@ class TerminateProductDryRunTask(ProvisioningTask):
         self.info(
             f"starting dry run terminate try {self.try_count} of {self.retry_count}"
         )
+        prefix = f"[{self.launch_name}] {self.account_id}:{self.region}"
 
         with self.spoke_regional_client("servicecatalog") as service_catalog:
-            self.info(
-                f"[{self.launch_name}] {self.account_id}:{self.region} :: looking for previous failures"
-            )
+            self.info(f"{prefix} :: looking for previous failures")
             r = aws.get_provisioned_product_details(
                 self.product_id, self.launch_name, service_catalog
             )
@@ -937,56 +1014,45 @@ class TerminateProductDryRunTask(ProvisioningTask):
                 self.write_result(
                     "-", "-", constants.NO_CHANGE, notes="There is nothing to terminate"
                 )
+            elif r.get("Status") != "TERMINATED":
+                response = service_catalog.describe_provisioning_artifact(
+                    ProvisioningArtifactId=r.get("ProvisioningArtifactId"),
+                    ProductId=self.product_id,
+                )
+                self.write_result(
+                    response.get("ProvisioningArtifactDetail").get("Name"),
+                    "-",
+                    constants.CHANGE,
+                    notes="The product would be terminated",
+                )
             else:
-                provisioned_product_name = (
-                    service_catalog.describe_provisioning_artifact(
-                        ProvisioningArtifactId=r.get("ProvisioningArtifactId"),
-                        ProductId=self.product_id,
-                    )
-                    .get("ProvisioningArtifactDetail")
-                    .get("Name")
+                self.write_result(
+                    "-",
+                    "-",
+                    constants.CHANGE,
+                    notes="The product is already terminated",
                 )
 
-                if r.get("Status") != "TERMINATED":
-                    self.write_result(
-                        provisioned_product_name,
-                        "-",
-                        constants.CHANGE,
-                        notes="The product would be terminated",
-                    )
-                else:
-                    self.write_result(
-                        "-",
-                        "-",
-                        constants.CHANGE,
-                        notes="The product is already terminated",
-                    )
-
 
 class RunDeployInSpokeTask(tasks.PuppetTask):
     manifest_file_path = luigi.Parameter()
     puppet_account_id = luigi.Parameter()
     account_id = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "account_id": self.account_id,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = ("puppet_account_id", "account_id", "cache_invalidator")
 
     def requires(self):
-        return dict(
-            shares=generate.GenerateSharesTask(
+        return {
+            "shares": generate.GenerateSharesTask(
                 puppet_account_id=self.puppet_account_id,
                 manifest_file_path=self.manifest_file_path,
                 section=constants.LAUNCHES,
             ),
-            new_manifest=portfoliomanagement_tasks.GenerateManifestWithIdsTask(
+            "new_manifest": portfoliomanagement_tasks.GenerateManifestWithIdsTask(
                 puppet_account_id=self.puppet_account_id,
                 manifest_file_path=self.manifest_file_path,
             ),
-        )
+        }
 
     def run(self):
         home_region = config.get_home_region(self.puppet_account_id)
@@ -1002,11 +1068,7 @@ class RunDeployInSpokeTask(tasks.PuppetTask):
         with self.hub_client("s3") as s3:
             bucket = f"sc-puppet-spoke-deploy-{self.puppet_account_id}"
             key = f"{os.getenv('CODEBUILD_BUILD_NUMBER', '0')}.yaml"
-            s3.put_object(
-                Body=self.input().get("new_manifest").open("r").read(),
-                Bucket=bucket,
-                Key=key,
-            )
+            s3.upload_file(self.input().get("new_manifest").path, bucket, key)
             signed_url = s3.generate_presigned_url(
                 "get_object",
                 Params={"Bucket": bucket, "Key": key},
@@ -1056,101 +1118,41 @@ class LaunchForSpokeExecutionTask(ProvisioningTask, dependency.DependenciesMixin
     launch_name = luigi.Parameter()
     puppet_account_id = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "launch_name": self.launch_name,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = ("puppet_account_id", "launch_name", "cache_invalidator")
 
     def requires(self):
-        from servicecatalog_puppet.workflow import codebuild_runs
-        from servicecatalog_puppet.workflow import spoke_local_portfolios
-        from servicecatalog_puppet.workflow import assertions
-        from servicecatalog_puppet.workflow import lambda_invocations
-
+        dependency_klasses = get_spoke_execution_dependency_klasses()
         these_dependencies = list()
-        common_args = dict(
-            manifest_file_path=self.manifest_file_path,
-            puppet_account_id=self.puppet_account_id,
-        )
+        common_args = {
+            "manifest_file_path": self.manifest_file_path,
+            "puppet_account_id": self.puppet_account_id,
+        }
         dependencies = self.manifest.get_launch(self.launch_name).get("depends_on", [])
         for depends_on in dependencies:
-            depends_on_affinity = depends_on.get(constants.AFFINITY)
             depends_on_type = depends_on.get("type")
-            if depends_on_type == constants.LAUNCH:
-                if depends_on_affinity == constants.LAUNCH:
-                    dep = self.manifest.get_launch(depends_on.get("name"))
-                    if dep.get("execution") == constants.EXECUTION_MODE_SPOKE:
-                        these_dependencies.append(
-                            LaunchForSpokeExecutionTask(
-                                **common_args, launch_name=depends_on.get("name"),
-                            )
-                        )
-                    else:
-                        these_dependencies.append(
-                            LaunchTask(
-                                **common_args, launch_name=depends_on.get("name"),
-                            )
-                        )
-                else:
-                    raise Exception(
-                        "Could can only depend on a launch using affinity launch when using spoke execution mode"
-                    )
-
-            elif depends_on_type == constants.SPOKE_LOCAL_PORTFOLIO:
-                if depends_on_affinity == constants.SPOKE_LOCAL_PORTFOLIO:
-                    these_dependencies.append(
-                        spoke_local_portfolios.SpokeLocalPortfolioTask(
-                            **common_args,
-                            spoke_local_portfolio_name=depends_on.get("name"),
-                        )
-                    )
-                else:
-                    raise Exception(
-                        "Could can only depend on a spoke_local_portfolio using affinity spoke_local_portfolios when using spoke execution mode"
-                    )
-
-            elif depends_on_type == constants.ASSERTION:
-                if depends_on_affinity == constants.ASSERTION:
-                    these_dependencies.append(
-                        assertions.AssertionTask(
-                            **common_args, assertion_name=depends_on.get("name"),
-                        )
-                    )
-                else:
-                    raise Exception(
-                        "Could can only depend on an assertion using affinity assertion when using spoke execution mode"
-                    )
-
-            elif depends_on_type == constants.CODE_BUILD_RUN:
-                if depends_on_affinity == constants.CODE_BUILD_RUN:
-                    these_dependencies.append(
-                        codebuild_runs.CodeBuildRunTask(
-                            **common_args, code_build_run_name=depends_on.get("name"),
-                        )
-                    )
-                else:
-                    raise Exception(
-                        "Could can only depend on a code_build_run using affinity code_build_run when using spoke execution mode"
-                    )
-
-            elif depends_on_type == constants.LAMBDA_INVOCATION:
-                if depends_on_affinity == constants.LAMBDA_INVOCATION:
-                    these_dependencies.append(
-                        lambda_invocations.LambdaInvocationTask(
-                            **common_args,
-                            lambda_invocation_name=depends_on.get("name"),
-                        )
-                    )
-                else:
-                    raise Exception(
-                        "Could can only depend on a lambda_invocation using affinity lambda_invocation when using spoke execution mode"
-                    )
+            depends_on_name = depends_on.get("name")
+            if depends_on_type not in dependency_klasses:
+                continue
+
+            klass, name_parameter, description = dependency_klasses[depends_on_type]
+            if depends_on.get(constants.AFFINITY) != depends_on_type:
+                raise Exception(
+                    f"Could can only depend on {description} when using spoke execution mode"
+                )
+            if (
+                depends_on_type == constants.LAUNCH
+                and self.manifest.get_launch(depends_on_name).get("execution")
+                == constants.EXECUTION_MODE_SPOKE
+            ):
+                klass = LaunchForSpokeExecutionTask
+
+            these_dependencies.append(
+                klass(**common_args, **{name_parameter: depends_on_name})
+            )
 
         return these_dependencies
 
-    @functools.lru_cache(maxsize=8)
+    @utils.memoize
     def get_tasks(self):
         tasks_to_run = list()
         for account_id in self.manifest.get_account_ids_used_for_section_item(
@@ -1175,12 +1177,11 @@ class LaunchForTask(ProvisioningTask):
     launch_name = luigi.Parameter()
     puppet_account_id = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "launch_name": self.launch_name,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = ("puppet_account_id", "launch_name", "cache_invalidator")
+
+    @utils.memoize
+    def requires(self):
+        return self.get_requirements()
 
     def get_klass_for_provisioning(self):
         if self.is_dry_run:
@@ -1205,20 +1206,20 @@ class LaunchForTask(ProvisioningTask):
 class LaunchForRegionTask(LaunchForTask):
     region = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "launch_name": self.launch_name,
-            "region": self.region,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "launch_name",
+        "region",
+        "cache_invalidator",
+    )
 
-    def requires(self):
+    def get_requirements(self):
         dependencies = list()
         these_dependencies = list()
-        requirements = dict(
-            dependencies=dependencies, these_dependencies=these_dependencies,
-        )
+        requirements = {
+            "dependencies": dependencies,
+            "these_dependencies": these_dependencies,
+        }
 
         klass = self.get_klass_for_provisioning()
 
@@ -1233,18 +1234,17 @@ class LaunchForRegionTask(LaunchForTask):
                 klass(**task, manifest_file_path=self.manifest_file_path)
             )
 
-        launch = self.manifest.get(self.section_name).get(self.launch_name)
-        for depends_on in launch.get("depends_on", []):
-            if depends_on.get("type") == self.section_name:
-                if depends_on.get(constants.AFFINITY) == "region":
-                    these_dependencies.append(
-                        self.__class__(
-                            manifest_file_path=self.manifest_file_path,
-                            launch_name=depends_on.get("name"),
-                            puppet_account_id=self.puppet_account_id,
-                            region=self.region,
-                        )
-                    )
+        for depends_on_name in self.manifest.get_depends_on_names_for(
+            self.section_name, self.launch_name, self.section_name, "region"
+        ):
+            these_dependencies.append(
+                self.__class__(
+                    manifest_file_path=self.manifest_file_path,
+                    launch_name=depends_on_name,
+                    puppet_account_id=self.puppet_account_id,
+                    region=self.region,
+                )
+            )
 
         return requirements
 
@@ -1252,17 +1252,16 @@ class LaunchForRegionTask(LaunchForTask):
 class LaunchForAccountTask(LaunchForTask):
     account_id = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "launch_name": self.launch_name,
-            "account_id": self.account_id,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "launch_name",
+        "account_id",
+        "cache_invalidator",
+    )
 
-    def requires(self):
+    def get_requirements(self):
         dependencies = list()
-        requirements = dict(dependencies=dependencies,)
+        requirements = {"dependencies": dependencies}
 
         klass = self.get_klass_for_provisioning()
 
@@ -1285,18 +1284,17 @@ class LaunchForAccountAndRegionTask(LaunchForTask):
     account_id = luigi.Parameter()
     region = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "launch_name": self.launch_name,
-            "account_id": self.account_id,
-            "region": self.region,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = (
+        "puppet_account_id",
+        "launch_name",
+        "account_id",
+        "region",
+        "cache_invalidator",
+    )
 
-    def requires(self):
+    def get_requirements(self):
         dependencies = list()
-        requirements = dict(dependencies=dependencies)
+        requirements = {"dependencies": dependencies}
 
         klass = self.get_klass_for_provisioning()
 
@@ -1316,14 +1314,9 @@ class LaunchForAccountAndRegionTask(LaunchForTask):
 
 
 class LaunchTask(LaunchForTask):
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "launch_name": self.launch_name,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = ("puppet_account_id", "launch_name", "cache_invalidator")
 
-    def requires(self):
+    def get_requirements(self):
         requirements = list()
 
         klass = self.get_klass_for_provisioning()
@@ -1357,17 +1350,11 @@ class ResetProvisionedProductOwnerTask(ProvisioningTask):
     account_id = luigi.Parameter()
     region = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "launch_name": self.launch_name,
-            "account_id": self.account_id,
-            "region": self.region,
-            "cache_invalidator": self.cache_invalidator,
-        }
+    results_display_keys = ("launch_name", "account_id", "region", "cache_invalidator")
 
     def api_calls_used(self):
         return [
-            f"servicecatalog.scan_provisioned_products_single_page_{self.account_id}_{self.region}",
+            f"servicecatalog.search_provisioned_products_{self.account_id}_{self.region}",
             f"servicecatalog.update_provisioned_product_properties_{self.account_id}_{self.region}",
         ]
 
@@ -1376,19 +1363,24 @@ class ResetProvisionedProductOwnerTask(ProvisioningTask):
 
         with self.spoke_regional_client("servicecatalog") as service_catalog:
             self.info(f"Checking if existing provisioned product exists")
-            all_results = service_catalog.scan_provisioned_products_single_page(
-                AccessLevelFilter={"Key": "Account", "Value": "self"},
-            ).get("ProvisionedProducts", [])
-            changes_made = list()
-            for result in all_results:
-                if result.get("Name") == self.launch_name:
-                    provisioned_product_id = result.get("Id")
-                    self.info(f"Ensuring current provisioned product owner is correct")
-                    changes_made.append(result)
-                    service_catalog.update_provisioned_product_properties(
-                        ProvisionedProductId=provisioned_product_id,
-                        ProvisionedProductProperties={
-                            "OWNER": config.get_puppet_role_arn(self.account_id)
-                        },
+            changes_made = aws.search_provisioned_products_by_name(
+                service_catalog, self.launch_name
+            )
+            if changes_made:
+                self.info(f"Ensuring current provisioned product owner is correct")
+                owner = config.get_puppet_role_arn(self.account_id)
+                with futures.ThreadPoolExecutor(
+                    max_workers=min(
+                        len(changes_made), UPDATE_PROVISIONED_PRODUCT_OWNER_MAX_WORKERS
+                    )
+                ) as executor:
+                    list(
+                        executor.map(
+                            lambda result: service_catalog.update_provisioned_product_properties(
+                                ProvisionedProductId=result.get("Id"),
+                                ProvisionedProductProperties={"OWNER": owner},
+                            ),
+                            changes_made,
+                        )
                     )
             self.write_output(changes_made)
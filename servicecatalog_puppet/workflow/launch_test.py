@@ -1,4 +1,7 @@
-from unittest import skip
+import json
+from unittest import skip, mock
+
+from botocore import exceptions as botocore_exceptions
 
 from workflow import tasks_unit_tests_helper
 
@@ -65,6 +68,111 @@ class ProvisioningTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
 
         self.wire_up_mocks()
 
+    def test_get_params_to_use(self):
+        # setup
+        provisioning_artifact_parameters = [
+            {"ParameterKey": "foo", "DefaultValue": "default-foo"},
+            {"ParameterKey": "bar", "DefaultValue": "default-bar"},
+            {"ParameterKey": "baz"},
+        ]
+        all_params = {"foo": "provided-foo", "unused": "provided-unused"}
+        expected_result = {
+            "foo": "provided-foo",
+            "bar": "default-bar",
+            "baz": None,
+        }
+
+        # exercise
+        actual_result = self.sut.get_params_to_use(
+            provisioning_artifact_parameters, all_params
+        )
+
+        # verify
+        self.assertDictEqual(expected_result, actual_result)
+
+
+class ListLaunchPathsTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
+    manifest_file_path = "manifest_file_path"
+    puppet_account_id = "puppet_account_id"
+    portfolio = "portfolio"
+    product_id = "product_id"
+    account_id = "account_id"
+    region = "region"
+
+    def setUp(self) -> None:
+        from servicecatalog_puppet.workflow import launch
+
+        self.module = launch
+
+        self.sut = self.module.ListLaunchPathsTask(
+            manifest_file_path=self.manifest_file_path,
+            puppet_account_id=self.puppet_account_id,
+            portfolio=self.portfolio,
+            product_id=self.product_id,
+            account_id=self.account_id,
+            region=self.region,
+        )
+
+        self.wire_up_mocks()
+
+    def test_run_with_one_launch_path(self):
+        # setup
+        launch_path = dict(Id="lpv-1", Name="other-portfolio")
+        self.inject_hub_regional_client_called_with_response(
+            "servicecatalog",
+            "list_launch_paths",
+            dict(LaunchPathSummaries=[launch_path]),
+        )
+
+        # exercise
+        self.sut.run()
+
+        # verify
+        self.assert_hub_regional_client_called_with(
+            "servicecatalog", "list_launch_paths", dict(ProductId=self.product_id),
+        )
+        self.assert_output(launch_path)
+
+    def test_run_with_many_launch_paths(self):
+        # setup
+        launch_path = dict(Id="lpv-2", Name=self.portfolio)
+        self.inject_hub_regional_client_called_with_response(
+            "servicecatalog",
+            "list_launch_paths",
+            dict(
+                LaunchPathSummaries=[
+                    dict(Id="lpv-1", Name="other-portfolio"),
+                    launch_path,
+                ]
+            ),
+        )
+
+        # exercise
+        self.sut.run()
+
+        # verify
+        self.assert_output(launch_path)
+
+    def test_run_without_a_matching_launch_path(self):
+        # setup
+        self.inject_hub_regional_client_called_with_response(
+            "servicecatalog",
+            "list_launch_paths",
+            dict(
+                LaunchPathSummaries=[
+                    dict(Id="lpv-1", Name="other-portfolio"),
+                    dict(Id="lpv-2", Name="another-portfolio"),
+                ]
+            ),
+        )
+
+        # exercise
+        with self.assertRaises(Exception):
+            self.sut.run()
+
+        # verify
+        self.sut.write_output.assert_not_called()
+
 
 class ProvisioningArtifactParametersTaskTest(
     tasks_unit_tests_helper.PuppetTaskUnitTest
@@ -119,14 +227,168 @@ class ProvisioningArtifactParametersTaskTest(
         # verify
         self.assertEqual(expected_result, actual_result)
 
-    @skip
+    def test_requires(self):
+        # setup
+        # exercise
+        actual_result = self.sut.requires()
+
+        # verify
+        self.assertEqual(
+            {
+                "parameters": self.module.DoDescribeProvisioningParameters(
+                    manifest_file_path=self.manifest_file_path,
+                    puppet_account_id=self.puppet_account_id,
+                    account_id=self.puppet_account_id,
+                    region=self.region,
+                    portfolio=self.portfolio,
+                    product=self.product,
+                    version=self.version,
+                )
+            },
+            actual_result,
+        )
+
     def test_run(self):
         # setup
+        parameters = '[{"ParameterKey": "foo"}]'
+        self.inject_into_input("parameters", parameters)
+
         # exercise
-        actual_result = self.sut.run()
+        self.sut.run()
 
         # verify
-        raise NotImplementedError()
+        self.sut.write_output.assert_called_once_with(parameters, skip_json_dump=True)
+
+
+class DoDescribeProvisioningParametersTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
+    manifest_file_path = "manifest_file_path"
+    puppet_account_id = "puppet_account_id"
+    account_id = "account_id"
+    portfolio = "portfolio"
+    product = "product"
+    version = "version"
+    region = "region"
+
+    def setUp(self) -> None:
+        from servicecatalog_puppet.workflow import launch
+
+        self.module = launch
+
+        self.sut = self.module.DoDescribeProvisioningParameters(
+            manifest_file_path=self.manifest_file_path,
+            puppet_account_id=self.puppet_account_id,
+            account_id=self.account_id,
+            portfolio=self.portfolio,
+            product=self.product,
+            version=self.version,
+            region=self.region,
+        )
+
+        self.wire_up_mocks()
+
+    def test_params_for_results_display(self):
+        # setup
+        expected_result = {
+            "puppet_account_id": self.puppet_account_id,
+            "account_id": self.account_id,
+            "portfolio": self.portfolio,
+            "product": self.product,
+            "version": self.version,
+            "region": self.region,
+        }
+
+        # exercise
+        actual_result = self.sut.params_for_results_display()
+
+        # verify
+        self.assertEqual(expected_result, actual_result)
+
+    def test_api_calls_used(self):
+        # setup
+        expected_result = [
+            f"servicecatalog.describe_provisioning_parameters_{self.account_id}_{self.region}",
+        ]
+
+        # exercise
+        actual_result = self.sut.api_calls_used()
+
+        # verify
+        self.assertEqual(expected_result, actual_result)
+
+    def wire_up_service_catalog(self, side_effect):
+        self.inject_into_input(
+            "details",
+            json.dumps(
+                {
+                    "product_details": {"ProductId": "prod-id"},
+                    "version_details": {"Id": "pa-id"},
+                }
+            ),
+        )
+        service_catalog = self.hub_regional_client_mock
+        service_catalog.exceptions.ClientError = botocore_exceptions.ClientError
+        service_catalog.describe_provisioning_parameters.side_effect = side_effect
+        patcher = mock.patch.object(self.module, "time")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return service_catalog
+
+    def access_denied(self):
+        return botocore_exceptions.ClientError(
+            {
+                "Error": {
+                    "Code": "ValidationException",
+                    "Message": "S3 error: Access Denied",
+                }
+            },
+            "DescribeProvisioningParameters",
+        )
+
+    def test_run(self):
+        # setup
+        parameters = [{"ParameterKey": "foo"}]
+        service_catalog = self.wire_up_service_catalog(
+            [self.access_denied(), {"ProvisioningArtifactParameters": parameters}]
+        )
+
+        # exercise
+        self.sut.run()
+
+        # verify
+        self.sut.hub_regional_client.assert_called_once_with(
+            "servicecatalog",
+            account_id=self.account_id,
+            config=self.module.RETRYING_CLIENT_CONFIG,
+        )
+        service_catalog.describe_provisioning_parameters.assert_called_with(
+            ProductId="prod-id",
+            ProvisioningArtifactId="pa-id",
+            PathName=self.portfolio,
+        )
+        self.assertEqual(2, service_catalog.describe_provisioning_parameters.call_count)
+        self.module.time.sleep.assert_called_once_with(
+            self.module.DESCRIBE_PROVISIONING_PARAMETERS_S3_RETRY_DELAY_IN_SECONDS
+        )
+        self.assert_output(parameters)
+
+    def test_run_gives_up_on_access_denied(self):
+        # setup
+        service_catalog = self.wire_up_service_catalog(self.access_denied())
+
+        # exercise
+        with self.assertRaises(botocore_exceptions.ClientError):
+            self.sut.run()
+
+        # verify
+        self.assertEqual(
+            self.module.DESCRIBE_PROVISIONING_PARAMETERS_S3_RETRIES,
+            service_catalog.describe_provisioning_parameters.call_count,
+        )
+        self.assertEqual(
+            self.module.DESCRIBE_PROVISIONING_PARAMETERS_S3_RETRIES - 1,
+            self.module.time.sleep.call_count,
+        )
+        self.sut.write_output.assert_not_called()
 
 
 class ProvisionProductTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
@@ -390,6 +652,72 @@ class TerminateProductTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
         raise NotImplementedError()
 
 
+class DoTerminateProductTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
+    manifest_file_path = "manifest_file_path"
+    launch_name = "launch_name"
+    portfolio = "portfolio"
+    product = "product"
+    version = "version"
+    account_id = "account_id"
+    region = "region"
+    puppet_account_id = "puppet_account_id"
+    execution = "execution"
+
+    def setUp(self) -> None:
+        from servicecatalog_puppet.workflow import launch
+
+        self.module = launch
+
+        self.param_names = [f"/launch/output-{i}" for i in range(23)]
+        self.sut = self.module.DoTerminateProductTask(
+            manifest_file_path=self.manifest_file_path,
+            launch_name=self.launch_name,
+            portfolio=self.portfolio,
+            product=self.product,
+            version=self.version,
+            account_id=self.account_id,
+            region=self.region,
+            puppet_account_id=self.puppet_account_id,
+            ssm_param_outputs=[
+                {"param_name": param_name} for param_name in self.param_names
+            ],
+            execution=self.execution,
+        )
+
+        self.wire_up_mocks()
+        self.sut.output = mock.MagicMock()
+
+    def test_run(self):
+        # setup
+        self.inject_into_input(
+            "details", json.dumps({"product_details": {"ProductId": "prod-id"}})
+        )
+        self.hub_client_mock.delete_parameters.side_effect = lambda Names: {
+            "DeletedParameters": Names[1:],
+            "InvalidParameters": Names[:1],
+        }
+
+        # exercise
+        with mock.patch.object(
+            self.module.aws, "ensure_is_terminated", return_value=("pp-id", "pa-id")
+        ):
+            self.sut.run()
+
+        # verify
+        self.sut.hub_client.assert_called_once_with("ssm")
+        batches = [
+            call[1].get("Names")
+            for call in self.hub_client_mock.delete_parameters.call_args_list
+        ]
+        self.assertCountEqual(
+            [self.param_names[:10], self.param_names[10:20], self.param_names[20:]],
+            batches,
+        )
+        self.assertCountEqual(
+            self.param_names, [name for batch in batches for name in batch]
+        )
+
+
 class TerminateProductDryRunTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
     manifest_file_path = "manifest_file_path"
     launch_name = "launch_name"
@@ -463,14 +791,68 @@ class TerminateProductDryRunTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest)
         # verify
         self.assertEqual(expected_result, actual_result)
 
-    @skip
-    def test_run(self):
+    def run_with_provisioned_product(self, provisioned_product):
+        self.sut.write_result = mock.MagicMock()
+        with mock.patch.object(
+            self.module.aws,
+            "get_provisioned_product_details",
+            return_value=provisioned_product,
+        ):
+            self.sut.run()
+
+    def test_run_with_nothing_to_terminate(self):
         # setup
         # exercise
-        actual_result = self.sut.run()
+        self.run_with_provisioned_product(None)
 
         # verify
-        raise NotImplementedError()
+        self.spoke_regional_client_mock.describe_provisioning_artifact.assert_not_called()
+        self.sut.write_result.assert_called_once_with(
+            "-",
+            "-",
+            self.module.constants.NO_CHANGE,
+            notes="There is nothing to terminate",
+        )
+
+    def test_run_with_a_provisioned_product(self):
+        # setup
+        self.inject_client_with_response(
+            self.spoke_regional_client_mock,
+            "describe_provisioning_artifact",
+            {"ProvisioningArtifactDetail": {"Name": "v1"}},
+        )
+
+        # exercise
+        self.run_with_provisioned_product(
+            {"Status": "AVAILABLE", "ProvisioningArtifactId": "pa-id"}
+        )
+
+        # verify
+        self.spoke_regional_client_mock.describe_provisioning_artifact.assert_called_once_with(
+            ProvisioningArtifactId="pa-id", ProductId=self.product_id,
+        )
+        self.sut.write_result.assert_called_once_with(
+            "v1",
+            "-",
+            self.module.constants.CHANGE,
+            notes="The product would be terminated",
+        )
+
+    def test_run_with_a_terminated_product(self):
+        # setup
+        # exercise
+        self.run_with_provisioned_product(
+            {"Status": "TERMINATED", "ProvisioningArtifactId": "pa-id"}
+        )
+
+        # verify
+        self.spoke_regional_client_mock.describe_provisioning_artifact.assert_not_called()
+        self.sut.write_result.assert_called_once_with(
+            "-",
+            "-",
+            self.module.constants.CHANGE,
+            notes="The product is already terminated",
+        )
 
 
 class ResetProvisionedProductOwnerTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
@@ -511,7 +893,7 @@ class ResetProvisionedProductOwnerTaskTest(tasks_unit_tests_helper.PuppetTaskUni
     def test_api_calls_used(self):
         # setup
         expected_result = [
-            f"servicecatalog.scan_provisioned_products_single_page_{self.account_id}_{self.region}",
+            f"servicecatalog.search_provisioned_products_{self.account_id}_{self.region}",
             f"servicecatalog.update_provisioned_product_properties_{self.account_id}_{self.region}",
         ]
 
@@ -8,32 +8,29 @@ from servicecatalog_puppet.workflow import tasks
 from servicecatalog_puppet import constants
 
 
+@lru_cache()
+def load_manifest(manifest_file_path):
+    content = open(manifest_file_path, "r").read()
+    return manifest_utils.Manifest(yaml.safe_load(content))
+
+
 class ManifestMixen(object):
     manifest_file_path = luigi.Parameter()
 
     @property
-    @lru_cache()
     def manifest(self):
-        content = open(self.manifest_file_path, "r").read()
-        return manifest_utils.Manifest(yaml.safe_load(content))
+        return load_manifest(self.manifest_file_path)
 
 
 class SectionTask(tasks.PuppetTask, ManifestMixen):
     manifest_file_path = luigi.Parameter()
     puppet_account_id = luigi.Parameter()
 
-    def params_for_results_display(self):
-        return {
-            "puppet_account_id": self.puppet_account_id,
-            "manifest_file_path": self.manifest_file_path,
-            "cache_invalidator": self.cache_invalidator,
-        }
-
-    @property
-    @lru_cache()
-    def manifest(self):
-        content = open(self.manifest_file_path, "r").read()
-        return manifest_utils.Manifest(yaml.safe_load(content))
+    results_display_keys = (
+        "puppet_account_id",
+        "manifest_file_path",
+        "cache_invalidator",
+    )
 
     def handle_requirements_for(
         self,
@@ -178,7 +178,6 @@ class GetVersionIdByVersionName(PortfolioManagementTask, manifest_tasks.Manifest
                         "product_name": self.product,
                         "product_id": product_id,
                     },
-                    indent=4,
                     default=str,
                 )
             )
@@ -400,12 +399,8 @@ class ProvisionActionTask(PortfolioManagementTask):
             if param_details.get("ssm"):
                 if param_details.get("default"):
                     del param_details["default"]
-                ssm_parameter_name = param_details.get("ssm").get("name")
-                ssm_parameter_name = ssm_parameter_name.replace(
-                    "${AWS::Region}", self.region
-                )
-                ssm_parameter_name = ssm_parameter_name.replace(
-                    "${AWS::AccountId}", self.account_id
+                ssm_parameter_name = utils.replace_aws_placeholders(
+                    param_details.get("ssm").get("name"), self.account_id, self.region
                 )
                 ssm_params[param_name] = tasks.GetSSMParamTask(
                     parameter_name=param_name,
@@ -883,7 +878,6 @@ class CopyIntoSpokeLocalPortfolioTask(PortfolioManagementTask):
                         "product_versions_that_should_be_copied": product_versions_that_should_be_copied,
                         "products": product_name_to_id_dict,
                     },
-                    indent=4,
                     default=str,
                 )
             )
@@ -1012,7 +1006,6 @@ class ImportIntoSpokeLocalPortfolioTask(PortfolioManagementTask):
                         "portfolio": spoke_portfolio,
                         "products": product_name_to_id_dict,
                     },
-                    indent=4,
                     default=str,
                 )
             )
@@ -1,7 +1,9 @@
+import datetime
 import json
 import logging
 import math
 import os
+import threading
 import traceback
 from pathlib import Path
 
@@ -12,12 +14,35 @@ from luigi import format
 from luigi.contrib import s3
 from deepmerge import always_merger
 
-from servicecatalog_puppet import constants, config
+from servicecatalog_puppet import constants, config, utils
 from servicecatalog_puppet.workflow.dependency import generate_dependency_tasks
 
 logger = logging.getLogger("tasks")
 logger.setLevel(logging.INFO)
 
+CLIENT_CREDENTIALS_EXPIRY_MARGIN = datetime.timedelta(minutes=5)
+
+# per process, so with more than one worker luigi forks and only a task's own
+# repeat lookups hit
+clients = dict()
+clients_lock = threading.Lock()
+
+
+def get_cross_account_client(service, role_arn, role_session_name, **kwargs):
+    key = (service, role_arn, role_session_name, tuple(sorted(kwargs.items())))
+    with clients_lock:
+        client, expiration = clients.get(key, (None, None))
+        if client is None or expiration - CLIENT_CREDENTIALS_EXPIRY_MARGIN <= (
+            datetime.datetime.now(datetime.timezone.utc)
+        ):
+            client_context_manager = betterboto_client.CrossAccountClientContextManager(
+                service, role_arn, role_session_name, **kwargs
+            )
+            client = client_context_manager.__enter__()
+            expiration = client_context_manager.credentials.get("Expiration")
+            clients[key] = (client, expiration)
+        return client
+
 
 def unwrap(what):
     if hasattr(what, "get_wrapped"):
@@ -76,20 +101,40 @@ class PuppetTask(luigi.Task):
             region_name=self.region,
         )
 
-    def hub_client(self, service):
+    def hub_client(self, service, **kwargs):
         return betterboto_client.CrossAccountClientContextManager(
             service,
             config.get_puppet_role_arn(self.puppet_account_id),
             f"{self.puppet_account_id}-{config.get_puppet_role_name()}",
+            **kwargs,
         )
 
-    def hub_regional_client(self, service, region_name=None):
+    def hub_regional_client(self, service, region_name=None, account_id=None, **kwargs):
         region = region_name or self.region
+        account_id = account_id or self.puppet_account_id
         return betterboto_client.CrossAccountClientContextManager(
             service,
-            config.get_puppet_role_arn(self.puppet_account_id),
-            f"{self.puppet_account_id}-{region}-{config.get_puppet_role_name()}",
+            config.get_puppet_role_arn(account_id),
+            f"{account_id}-{region}-{config.get_puppet_role_name()}",
             region_name=region,
+            **kwargs,
+        )
+
+    def cached_spoke_regional_client(self, service, **kwargs):
+        return get_cross_account_client(
+            service,
+            config.get_puppet_role_arn(self.account_id),
+            f"{self.account_id}-{self.region}-{config.get_puppet_role_name()}",
+            region_name=self.region,
+            **kwargs,
+        )
+
+    def cached_hub_client(self, service, **kwargs):
+        return get_cross_account_client(
+            service,
+            config.get_puppet_role_arn(self.puppet_account_id),
+            f"{self.puppet_account_id}-{config.get_puppet_role_name()}",
+            **kwargs,
         )
 
     def read_from_input(self, input_name):
@@ -151,15 +196,17 @@ class PuppetTask(luigi.Task):
     def uid(self):
         return f"{self.__class__.__name__}/{self.node_id}"
 
+    results_display_keys = ()
+
     def params_for_results_display(self):
-        return {}
+        return {key: getattr(self, key) for key in self.results_display_keys}
 
     def write_output(self, content, skip_json_dump=False):
         with self.output().open("w") as f:
             if skip_json_dump:
                 f.write(content)
             else:
-                f.write(json.dumps(content, indent=4, default=str,))
+                f.write(json.dumps(content, default=str,))
 
     @property
     def node_id(self):
@@ -231,11 +278,15 @@ class GetSSMParamTask(PuppetTask):
 
 
 class PuppetTaskWithParameters(PuppetTask):
+    @utils.memoize
+    def get_unwrapped(self, parameter_name):
+        return unwrap(getattr(self, parameter_name))
+
     def get_all_of_the_params(self):
         all_params = dict()
-        always_merger.merge(all_params, unwrap(self.manifest_parameters))
-        always_merger.merge(all_params, unwrap(self.launch_parameters))
-        always_merger.merge(all_params, unwrap(self.account_parameters))
+        always_merger.merge(all_params, self.get_unwrapped("manifest_parameters"))
+        always_merger.merge(all_params, self.get_unwrapped("launch_parameters"))
+        always_merger.merge(all_params, self.get_unwrapped("account_parameters"))
         return all_params
 
     def get_ssm_parameters(self):
@@ -247,12 +298,8 @@ class PuppetTaskWithParameters(PuppetTask):
             if param_details.get("ssm"):
                 if param_details.get("default"):
                     del param_details["default"]
-                ssm_parameter_name = param_details.get("ssm").get("name")
-                ssm_parameter_name = ssm_parameter_name.replace(
-                    "${AWS::Region}", self.region
-                )
-                ssm_parameter_name = ssm_parameter_name.replace(
-                    "${AWS::AccountId}", self.account_id
+                ssm_parameter_name = utils.replace_aws_placeholders(
+                    param_details.get("ssm").get("name"), self.account_id, self.region
                 )
                 ssm_params[param_name] = GetSSMParamTask(
                     parameter_name=param_name,
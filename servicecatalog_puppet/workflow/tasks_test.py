@@ -1,4 +1,6 @@
-from unittest import skip
+import datetime
+import unittest
+from unittest import skip, mock
 
 from . import tasks_unit_tests_helper
 
@@ -71,3 +73,85 @@ class GetSSMParamTaskTest(tasks_unit_tests_helper.PuppetTaskUnitTest):
 
         # verify
         raise NotImplementedError()
+
+
+class GetCrossAccountClientTest(unittest.TestCase):
+    service = "ssm"
+    role_arn = "role_arn"
+    role_session_name = "role_session_name"
+
+    def setUp(self) -> None:
+        from servicecatalog_puppet.workflow import tasks
+
+        self.module = tasks
+
+        patcher = mock.patch.dict(self.module.clients, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.expirations = []
+        patcher = mock.patch.object(
+            self.module.betterboto_client,
+            "CrossAccountClientContextManager",
+            side_effect=self.cross_account_client,
+        )
+        self.cross_account_client_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def cross_account_client(self, *args, **kwargs):
+        client_context_manager = mock.MagicMock()
+        client_context_manager.__enter__.return_value = mock.MagicMock()
+        client_context_manager.credentials = {
+            "Expiration": datetime.datetime.now(datetime.timezone.utc)
+            + self.expirations.pop(0)
+        }
+        return client_context_manager
+
+    def get_client(self, **kwargs):
+        return self.module.get_cross_account_client(
+            self.service, self.role_arn, self.role_session_name, **kwargs
+        )
+
+    def test_get_cross_account_client_is_cached(self):
+        # setup
+        self.expirations = [datetime.timedelta(hours=1)]
+
+        # exercise
+        first = self.get_client(region_name="eu-west-1")
+        second = self.get_client(region_name="eu-west-1")
+
+        # verify
+        self.assertIs(first, second)
+        self.cross_account_client_mock.assert_called_once_with(
+            self.service, self.role_arn, self.role_session_name, region_name="eu-west-1"
+        )
+
+    def test_get_cross_account_client_is_keyed_on_kwargs(self):
+        # setup
+        self.expirations = [datetime.timedelta(hours=1), datetime.timedelta(hours=1)]
+
+        # exercise
+        first = self.get_client(region_name="eu-west-1")
+        second = self.get_client(region_name="eu-west-2")
+
+        # verify
+        self.assertIsNot(first, second)
+        self.assertEqual(2, self.cross_account_client_mock.call_count)
+
+    def test_get_cross_account_client_is_refreshed_near_expiry(self):
+        # setup
+        self.expirations = [
+            self.module.CLIENT_CREDENTIALS_EXPIRY_MARGIN
+            - datetime.timedelta(minutes=1),
+            datetime.timedelta(hours=1),
+        ]
+
+        # exercise
+        first = self.get_client()
+        second = self.get_client()
+        third = self.get_client()
+
+        # verify
+        self.assertIsNot(first, second)
+        self.assertIs(second, third)
+        self.assertEqual(2, self.cross_account_client_mock.call_count)